@@ -7,7 +7,7 @@ Integrates the FastAgentOrchestrator with the main Sentinel application
 import asyncio
 import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 
 from sentinel.app.core import FileMetadata, scan_directory, extract_content
 from sentinel.app.db import DatabaseManager
@@ -105,13 +105,19 @@ class AgenticPipeline:
         if self.logger:
             self.logger.info("🚀 Agentic Pipeline initialized with FastAgentOrchestrator")
     
-    async def run_analysis_async(self, directory: str | Path) -> List[Dict[str, Any]]:
+    async def run_analysis_async(self, directory: str | Path,
+                                 cancel_cb: Optional[Callable[[], bool]] = None,
+                                 progress_cb: Optional[Callable[[int, int, str], None]] = None) -> List[Dict[str, Any]]:
         """
         Run the full agentic analysis pipeline asynchronously.
         
         This is the main entry point that replaces the traditional pipeline
-        with our optimized agentic system.
+        with our optimized agentic system. If *cancel_cb* returns True the
+        pipeline stops at the next file and returns the results persisted so far.
+        *progress_cb* is called as ``progress_cb(processed, total, current_file)``
+        after each file is persisted.
         """
+        cancelled = cancel_cb or (lambda: False)
         if self.logger:
             self.logger.info(f"🎯 Starting agentic analysis for directory: {directory}")
         
@@ -130,9 +136,16 @@ class AgenticPipeline:
             file_paths = []
             
             for meta in scan_directory(directory):
+                if cancelled():
+                    break
                 file_metadata_list.append(meta)
                 file_paths.append(str(meta.path))
             
+            if cancelled():
+                if self.logger:
+                    self.logger.info("Agentic analysis cancelled during scan")
+                return []
+            
             if self.logger:
                 self.logger.info(f"📊 Found {len(file_paths)} files to analyze")
             
@@ -153,6 +166,10 @@ class AgenticPipeline:
                 self.logger.info("💾 Phase 3: Persisting results...")
             
             for i, (meta, agentic_result) in enumerate(zip(file_metadata_list, agentic_results)):
+                if cancelled():
+                    if self.logger:
+                        self.logger.info(f"Agentic analysis cancelled after {len(results)} files")
+                    break
                 try:
                     # Save file metadata to database
                     file_id = self.db.save_scan_result(meta.as_dict())
@@ -199,6 +216,9 @@ class AgenticPipeline:
                         "processing_time_ms": 0,
                         "success": False
                     })
+                
+                if progress_cb is not None:
+                    progress_cb(i + 1, len(file_paths), str(meta.path))
             
             # Phase 4: Performance reporting
             total_time = time.time() - start_time
@@ -209,7 +229,7 @@ class AgenticPipeline:
                 self.logger.info(f"   Files processed: {len(file_paths)}")
                 self.logger.info(f"   Total time: {total_time:.2f}s")
                 self.logger.info(f"   Throughput: {throughput:.1f} files/sec")
-                self.logger.info(f"   Success rate: {len([r for r in results if r.get('success', True)])}/{len(results)}")
+                self.logger.info(f"   Success rate: {sum(1 for r in results if r.get('success', True))}/{len(results)}")
             
             # Log performance stats
             stats = self.orchestrator.get_performance_stats()
@@ -241,7 +261,9 @@ class AgenticPipeline:
 
 
 def run_agentic_analysis(directory: str | Path, *, db: DatabaseManager, config: AppConfig, 
-                        logger_manager=None, performance_monitor=None) -> List[Dict[str, Any]]:
+                        logger_manager=None, performance_monitor=None,
+                        cancel_cb: Optional[Callable[[], bool]] = None,
+                        progress_cb: Optional[Callable[[int, int, str], None]] = None) -> List[Dict[str, Any]]:
     """
     Synchronous wrapper for the agentic analysis pipeline.
     
@@ -257,18 +279,20 @@ def run_agentic_analysis(directory: str | Path, *, db: DatabaseManager, config:
             # If we're already in an event loop, we need to use a different approach
             import concurrent.futures
             with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, pipeline.run_analysis_async(directory))
+                future = executor.submit(asyncio.run, pipeline.run_analysis_async(directory, cancel_cb, progress_cb))
                 return future.result()
         else:
-            return loop.run_until_complete(pipeline.run_analysis_async(directory))
+            return loop.run_until_complete(pipeline.run_analysis_async(directory, cancel_cb, progress_cb))
     except RuntimeError:
         # No event loop exists, create a new one
-        return asyncio.run(pipeline.run_analysis_async(directory))
+        return asyncio.run(pipeline.run_analysis_async(directory, cancel_cb, progress_cb))
 
 
 # Backward compatibility - this can replace the original run_analysis function
 def run_analysis(directory: str | Path, *, db: DatabaseManager, config: AppConfig, 
-                logger_manager=None, performance_monitor=None) -> List[Dict[str, Any]]:
+                logger_manager=None, performance_monitor=None,
+                cancel_cb: Optional[Callable[[], bool]] = None,
+                progress_cb: Optional[Callable[[int, int, str], None]] = None) -> List[Dict[str, Any]]:
     """
     Enhanced analysis pipeline using the agentic system.
     
@@ -276,4 +300,5 @@ def run_analysis(directory: str | Path, *, db: DatabaseManager, config: AppConfi
     that provides massive performance improvements through the FastAgentOrchestrator.
     """
     return run_agentic_analysis(directory, db=db, config=config, 
-                               logger_manager=logger_manager, performance_monitor=performance_monitor)
\ No newline at end of file
+                               logger_manager=logger_manager, performance_monitor=performance_monitor,
+                               cancel_cb=cancel_cb, progress_cb=progress_cb)
\ No newline at end of file
@@ -6,6 +6,7 @@ later by an autonomous agent.
 """
 from __future__ import annotations
 
+from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Any, Mapping, Optional
 from pathlib import Path
@@ -81,25 +82,21 @@ class InferenceEngine:
             self.logger.debug(f"File metadata: {dict(metadata)}")
             self.logger.debug(f"Content length: {len(content)} characters")
         
-        # Start performance monitoring
-        operation_id = None
-        if self.performance_monitor:
-            operation_id = self.performance_monitor.start_operation(
-                'ai_inference', 
-                {'file_path': file_path, 'backend': self.backend_mode}
-            )
+        # Time the inference itself; failures inside the block are recorded by the tracker
+        tracker = self.performance_monitor.track('ai_inference') if self.performance_monitor else nullcontext()
         
         try:
-            # Build prompt for LLM
-            prompt = build_prompt(metadata, content)
-            
-            if self.logger_manager:
-                self.logger.debug(f"Generated prompt length: {len(prompt)} characters")
+            with tracker:
+                # Build prompt for LLM
+                prompt = build_prompt(metadata, content)
+                
+                if self.logger_manager:
+                    self.logger.debug(f"Generated prompt length: {len(prompt)} characters")
 
-            if self.backend_mode == "local":
-                result = self._process_local_inference(prompt, file_path)
-            else:  # cloud
-                result = self._process_cloud_inference(prompt, file_path)
+                if self.backend_mode == "local":
+                    result = self._process_local_inference(prompt, file_path)
+                else:  # cloud
+                    result = self._process_cloud_inference(prompt, file_path)
             
             # Calculate duration and log success
             duration = time.perf_counter() - start_time
@@ -110,8 +107,6 @@ class InferenceEngine:
             
             # Record performance metrics
             if self.performance_monitor:
-                if operation_id:
-                    self.performance_monitor.end_operation(operation_id, success=True)
                 self.performance_monitor.log_ai_request(
                     duration=duration,
                     success=True,
@@ -131,8 +126,6 @@ class InferenceEngine:
             
             # Record performance metrics for failure
             if self.performance_monitor:
-                if operation_id:
-                    self.performance_monitor.end_operation(operation_id, success=False, error_message=error_msg)
                 self.performance_monitor.log_ai_request(
                     duration=duration,
                     success=False,
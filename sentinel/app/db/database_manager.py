@@ -7,7 +7,7 @@ implemented by a background agent.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Sequence
 
 # pyright: reportGeneralTypeIssues=false
 from sqlalchemy import Boolean, Column, Float, ForeignKey, Integer, String, create_engine
@@ -100,6 +100,60 @@ class DatabaseManager:
             inf_obj.revised_path = inference.get("revised_path")
             session.commit()
 
+    def save_scan_results_many(self, metadata_rows: Sequence[dict[str, Any]]) -> list[int]:
+        """Persist many file metadata rows in one transaction.
+
+        Returns the file IDs in the same order as *metadata_rows*; paths that
+        already exist keep their original ID.
+        """
+        paths = [metadata.get("path") for metadata in metadata_rows]
+        if not all(paths):
+            raise ValueError("'path' key is required in metadata")
+
+        with self.SessionFactory() as session:
+            files = {
+                file_obj.path: file_obj
+                for file_obj in session.query(self.File).filter(self.File.path.in_(set(paths)))
+            }
+            for path, metadata in zip(paths, metadata_rows):
+                if path not in files:
+                    files[path] = self.File(
+                        path=path,
+                        mime_type=metadata.get("mime_type"),
+                        size=metadata.get("size"),
+                        creation_date=metadata.get("creation_date"),
+                        checksum=metadata.get("checksum"),
+                    )
+                    session.add(files[path])
+            session.flush()
+            file_ids = [files[path].id for path in paths]
+            session.commit()
+            return file_ids
+
+    def save_inferences_many(self, rows: Iterable[tuple[int, dict[str, Any]]]) -> None:
+        """Persist ``(file_id, inference)`` pairs in one transaction."""
+        rows = list(rows)
+        with self.SessionFactory() as session:
+            # Upsert pattern
+            existing = {
+                inf_obj.file_id: inf_obj
+                for inf_obj in session.query(self.Inference).filter(
+                    self.Inference.file_id.in_({file_id for file_id, _ in rows})
+                )
+            }
+            for file_id, inference in rows:
+                inf_obj = existing.get(file_id)
+                if inf_obj is None:
+                    inf_obj = existing[file_id] = self.Inference(file_id=file_id)
+                    session.add(inf_obj)
+
+                inf_obj.suggested_path = inference.get("suggested_path")
+                inf_obj.confidence = inference.get("confidence")
+                inf_obj.justification = inference.get("justification")
+                inf_obj.approved = inference.get("approved")
+                inf_obj.revised_path = inference.get("revised_path")
+            session.commit()
+
     def save_feedback(self, file_id: int, approved: bool, revised_path: str | None) -> None:
         with self.SessionFactory() as session:
             inf_obj = session.query(self.Inference).filter_by(file_id=file_id).one_or_none()
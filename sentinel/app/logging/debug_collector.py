@@ -8,7 +8,7 @@ import sqlite3
 import requests
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, TextIO
 import json
 import traceback
 
@@ -28,25 +28,11 @@ class DebugInfoCollector:
     def collect_system_info(self) -> Dict[str, Any]:
         """Collect system information for debugging."""
         try:
+            hardware = self.collect_hardware_info()
+            hardware['disk_usage'] = self.collect_disk_usage()
             system_info = {
-                'platform': {
-                    'system': platform.system(),
-                    'release': platform.release(),
-                    'version': platform.version(),
-                    'machine': platform.machine(),
-                    'processor': platform.processor(),
-                    'architecture': platform.architecture(),
-                    'python_version': sys.version,
-                    'python_executable': sys.executable
-                },
-                'hardware': {
-                    'cpu_count': psutil.cpu_count(),
-                    'cpu_percent': psutil.cpu_percent(interval=1),
-                    'memory_total_gb': round(psutil.virtual_memory().total / (1024**3), 2),
-                    'memory_available_gb': round(psutil.virtual_memory().available / (1024**3), 2),
-                    'memory_percent': psutil.virtual_memory().percent,
-                    'disk_usage': {}
-                },
+                'platform': self.collect_platform_info(),
+                'hardware': hardware,
                 'environment': {
                     'working_directory': os.getcwd(),
                     'python_path': sys.path[:5],  # First 5 entries to avoid clutter
@@ -57,18 +43,6 @@ class DebugInfoCollector:
                 }
             }
             
-            # Get disk usage for current directory
-            try:
-                disk_usage = psutil.disk_usage('.')
-                system_info['hardware']['disk_usage'] = {
-                    'total_gb': round(disk_usage.total / (1024**3), 2),
-                    'used_gb': round(disk_usage.used / (1024**3), 2),
-                    'free_gb': round(disk_usage.free / (1024**3), 2),
-                    'percent': round((disk_usage.used / disk_usage.total) * 100, 1)
-                }
-            except Exception:
-                system_info['hardware']['disk_usage'] = {'error': 'Unable to retrieve disk usage'}
-            
             return system_info
             
         except Exception as e:
@@ -80,6 +54,43 @@ class DebugInfoCollector:
                 self.logger.error(f"System info collection failed: {e}")
             return error_info
     
+    def collect_platform_info(self) -> Dict[str, Any]:
+        """Collect platform details, which don't change while the process runs."""
+        return {
+            'system': platform.system(),
+            'release': platform.release(),
+            'version': platform.version(),
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'architecture': platform.architecture(),
+            'python_version': sys.version,
+            'python_executable': sys.executable
+        }
+    
+    def collect_hardware_info(self, cpu_interval: Optional[float] = 1) -> Dict[str, Any]:
+        """Collect CPU and memory usage; cpu_interval=None samples without blocking."""
+        memory = psutil.virtual_memory()
+        return {
+            'cpu_count': psutil.cpu_count(),
+            'cpu_percent': psutil.cpu_percent(interval=cpu_interval),
+            'memory_total_gb': round(memory.total / (1024**3), 2),
+            'memory_available_gb': round(memory.available / (1024**3), 2),
+            'memory_percent': memory.percent,
+        }
+    
+    def collect_disk_usage(self, path: str = '.') -> Dict[str, Any]:
+        """Collect disk usage for the given path (the current directory by default)."""
+        try:
+            disk_usage = psutil.disk_usage(path)
+            return {
+                'total_gb': round(disk_usage.total / (1024**3), 2),
+                'used_gb': round(disk_usage.used / (1024**3), 2),
+                'free_gb': round(disk_usage.free / (1024**3), 2),
+                'percent': round((disk_usage.used / disk_usage.total) * 100, 1)
+            }
+        except Exception:
+            return {'error': 'Unable to retrieve disk usage'}
+    
     def collect_app_state(self) -> Dict[str, Any]:
         """Collect application state information."""
         try:
@@ -125,7 +136,7 @@ class DebugInfoCollector:
             
             # Add performance metrics if available
             if self.performance_monitor:
-                app_state['performance'] = self.performance_monitor.get_metrics()
+                app_state['performance'] = dict(self.performance_monitor.get_metrics())
             
             return app_state
             
@@ -295,27 +306,7 @@ class DebugInfoCollector:
     def generate_debug_report(self) -> str:
         """Generate a comprehensive debug report."""
         try:
-            report_data = {
-                'report_generated': datetime.now().isoformat(),
-                'system_info': self.collect_system_info(),
-                'application_state': self.collect_app_state(),
-                'ai_connectivity': self.test_ai_connectivity(),
-                'database_connectivity': self.test_database_connectivity()
-            }
-            
-            # Add recent logs if available
-            if self.logger_manager:
-                recent_logs = self.logger_manager.get_recent_logs(50)
-                report_data['recent_logs'] = [
-                    {
-                        'timestamp': log.timestamp.isoformat(),
-                        'level': log.level,
-                        'logger': log.logger_name,
-                        'message': log.message,
-                        'location': f"{log.module}:{log.line_number}:{log.function}"
-                    }
-                    for log in recent_logs
-                ]
+            report_data = self._collect_report_data()
             
             # Format as JSON for easy reading
             report_json = json.dumps(report_data, indent=2, default=str)
@@ -326,13 +317,57 @@ class DebugInfoCollector:
             return report_json
             
         except Exception as e:
-            error_report = {
-                'error': f"Failed to generate debug report: {str(e)}",
-                'traceback': traceback.format_exc(),
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            if self.logger_manager:
-                self.logger.error(f"Debug report generation failed: {e}")
-            
-            return json.dumps(error_report, indent=2)
\ No newline at end of file
+            return json.dumps(self._report_error(e), indent=2)
+    
+    def write_debug_report(self, f: TextIO) -> None:
+        """Write the debug report to an open text file, encoding it incrementally."""
+        try:
+            report_data = self._collect_report_data()
+        except Exception as e:
+            json.dump(self._report_error(e), f, indent=2)
+            return
+        
+        # json.dump streams the encoder's chunks instead of building one big string
+        json.dump(report_data, f, indent=2, default=str)
+        
+        if self.logger_manager:
+            self.logger.info("Debug report written successfully")
+    
+    def _collect_report_data(self) -> Dict[str, Any]:
+        """Collect everything that goes into the debug report."""
+        report_data = {
+            'report_generated': datetime.now().isoformat(),
+            'system_info': self.collect_system_info(),
+            'application_state': self.collect_app_state(),
+            'ai_connectivity': self.test_ai_connectivity(),
+            'database_connectivity': self.test_database_connectivity()
+        }
+        
+        # Add recent logs if available
+        if self.logger_manager:
+            recent_logs = self.logger_manager.get_recent_logs(50)
+            report_data['recent_logs'] = [
+                {
+                    'timestamp': log.timestamp.isoformat(),
+                    'level': log.level,
+                    'logger': log.logger_name,
+                    'message': log.message,
+                    'location': f"{log.module}:{log.line_number}:{log.function}"
+                }
+                for log in recent_logs
+            ]
+        
+        return report_data
+    
+    def _report_error(self, e: Exception) -> Dict[str, Any]:
+        """Build the report written in place of a report that failed to generate."""
+        error_report = {
+            'error': f"Failed to generate debug report: {str(e)}",
+            'traceback': traceback.format_exc(),
+            'timestamp': datetime.now().isoformat()
+        }
+        
+        if self.logger_manager:
+            self.logger.error(f"Debug report generation failed: {e}")
+        
+        return error_report
@@ -1,30 +1,138 @@
 """Performance monitoring and metrics collection for Sentinel."""
 
+import contextlib
+import itertools
 import time
 import threading
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-import uuid
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional
+import weakref
 
+# Thread-local buffers are flushed into the shared metrics once they hold
+# this many entries or this many seconds have passed since the last flush.
+FLUSH_BATCH_SIZE = 256
+FLUSH_INTERVAL = 0.1
 
-@dataclass
+# Durations are accumulated as integer nanoseconds and converted on read
+NS_PER_SECOND = 1_000_000_000
+
+# Log templates use lazy %-interpolation so nothing is formatted for filtered levels
+OPERATION_LOG_TEMPLATE = "Operation %s %s in %.3fs"
+OPERATION_FAILED_TEMPLATE = "Operation %s failed: %s"
+AI_LOG_TEMPLATE = "AI inference %s in %.3fs"
+AI_MODEL_LOG_TEMPLATE = "AI inference %s in %.3fs (model: %s)"
+SCAN_LOG_TEMPLATE = "File scan completed: %d files in %.3fs (%.1f files/sec) - Path: %s"
+DB_LOG_TEMPLATE = "Database %s %s in %.3fs"
+DB_ROWS_LOG_TEMPLATE = "Database %s %s in %.3fs (%d rows)"
+
+# Shared read-only metadata for operations started without any
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+class RingStats:
+    """Fixed-size window of recent values that keeps a running sum."""
+    
+    __slots__ = ('_values', 'sum')
+    
+    def __init__(self, maxlen: int):
+        self._values = deque(maxlen=maxlen)
+        self.sum = 0
+    
+    def append(self, value):
+        """Add a value, evicting (and un-summing) the oldest one when full."""
+        values = self._values
+        if len(values) == values.maxlen:
+            self.sum -= values[0]
+        values.append(value)
+        self.sum += value
+    
+    def extend(self, iterable):
+        """Append every value from ``iterable``."""
+        for value in iterable:
+            self.append(value)
+    
+    def __len__(self) -> int:
+        return len(self._values)
+    
+    def __iter__(self):
+        return iter(self._values)
+
+
+class ErrorRing:
+    """Fixed-capacity ring of recent errors kept as parallel arrays.
+    
+    Each error occupies one slot across the timestamp, duration, message and
+    detail arrays; dicts are only built when the errors are read.
+    """
+    
+    __slots__ = ('capacity', 'timestamps', 'durations', 'messages', 'details', 'count')
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamps = [0.0] * capacity
+        self.durations = [0.0] * capacity
+        self.messages: List[Optional[str]] = [None] * capacity
+        self.details: List[Optional[tuple]] = [None] * capacity
+        self.count = 0
+    
+    def append(self, timestamp: float, duration: float, message: str, detail: Optional[tuple] = None):
+        """Record an error, overwriting the oldest slot when full."""
+        i = self.count % self.capacity
+        self.timestamps[i] = timestamp
+        self.durations[i] = duration
+        self.messages[i] = message
+        self.details[i] = detail
+        self.count += 1
+    
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+    
+    def latest(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return up to *limit* most recent errors, oldest first, as dicts."""
+        size = len(self)
+        if limit is not None:
+            size = min(size, limit)
+        
+        errors = []
+        for index in range(self.count - size, self.count):
+            i = index % self.capacity
+            error = {
+                'timestamp': datetime.fromtimestamp(self.timestamps[i]).isoformat(),
+                'error': self.messages[i],
+                'duration': self.durations[i]
+            }
+            detail = self.details[i]
+            if detail is not None:
+                error[detail[0]] = detail[1]
+            errors.append(error)
+        return errors
+
+
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance metrics for a specific operation type."""
     operation_name: str
     total_calls: int = 0
-    total_duration: float = 0.0
+    total_duration_ns: int = 0
     success_count: int = 0
     error_count: int = 0
     last_24h_calls: int = 0
-    recent_durations: deque = field(default_factory=lambda: deque(maxlen=100))
-    recent_errors: deque = field(default_factory=lambda: deque(maxlen=50))
+    recent_durations: RingStats = field(default_factory=lambda: RingStats(maxlen=100))
+    recent_errors: ErrorRing = field(default_factory=lambda: ErrorRing(capacity=50))
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
     
     @property
     def average_duration(self) -> float:
         """Calculate average duration."""
-        return self.total_duration / self.total_calls if self.total_calls > 0 else 0.0
+        return self.total_duration_ns / self.total_calls / NS_PER_SECOND if self.total_calls > 0 else 0.0
+    
+    @property
+    def total_duration(self) -> float:
+        """Total duration in seconds."""
+        return self.total_duration_ns / NS_PER_SECOND
     
     @property
     def success_rate(self) -> float:
@@ -33,17 +141,64 @@ class PerformanceMetrics:
     
     @property
     def recent_average_duration(self) -> float:
-        """Calculate average duration for recent operations."""
-        return sum(self.recent_durations) / len(self.recent_durations) if self.recent_durations else 0.0
+        """Calculate average duration for recent operations.
+        
+        Calls enter ``recent_durations`` when their thread's buffer is flushed,
+        so with several threads this averages the last 100 *flushed* calls,
+        which may differ slightly from the last 100 to complete.
+        """
+        count = len(self.recent_durations)
+        return self.recent_durations.sum / count / NS_PER_SECOND if count else 0.0
+    
+    def record_batch(self, entries: List[tuple]):
+        """Apply ``(duration_ns, success, error)`` entries to the counters; caller holds ``_lock``.
+        
+        ``error`` is ``None`` or a ``(timestamp, duration, message, detail)`` tuple.
+        """
+        durations = [entry[0] for entry in entries]
+        successes = sum(1 for entry in entries if entry[1])
+        
+        self.total_calls += len(entries)
+        self.total_duration_ns += sum(durations)
+        self.recent_durations.extend(durations)
+        # Update 24h counter (simplified - in production, you'd want proper time-based tracking)
+        self.last_24h_calls += len(entries)
+        self.success_count += successes
+        self.error_count += len(entries) - successes
+        for entry in entries:
+            if entry[2] is not None:
+                self.recent_errors.append(*entry[2])
+
+
+def _drain_on_exit(pending: deque, monitor_ref: "weakref.ref[PerformanceMonitor]"):
+    """Finalizer for a thread buffer; holds the monitor only weakly."""
+    monitor = monitor_ref()
+    if monitor is not None:
+        monitor._drain(pending)
 
 
-@dataclass
+class _ThreadBuffer:
+    """Completed calls recorded by one thread, waiting to be flushed."""
+    
+    __slots__ = ('pending', 'last_flush', 'last_name', 'last_metrics', 'reset_epoch', '__weakref__')
+    
+    def __init__(self):
+        # deque.append/popleft are atomic, so other threads may drain it safely
+        self.pending = deque()
+        self.last_flush = time.monotonic()
+        # Last metrics entry this thread resolved, valid while reset_epoch matches
+        self.last_name = None
+        self.last_metrics = None
+        self.reset_epoch = -1
+
+
+@dataclass(slots=True)
 class ActiveOperation:
     """Represents an active operation being timed."""
-    operation_id: str
+    operation_id: int
     operation_name: str
-    start_time: float
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    start_time_ns: int
+    metadata: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_METADATA)
 
 
 class PerformanceMonitor:
@@ -53,13 +208,29 @@ class PerformanceMonitor:
         """Initialize the performance monitor."""
         self.logger_manager = logger_manager
         self._metrics: Dict[str, PerformanceMetrics] = {}
-        self._active_operations: Dict[str, ActiveOperation] = {}
+        self._active_operations: Dict[int, ActiveOperation] = {}
+        self._next_operation_id = itertools.count(1).__next__
+        # Guards insertions into ``_metrics``; counters use each entry's own lock
         self._lock = threading.Lock()
+        self._active_lock = threading.Lock()
+        self._tls = threading.local()
+        self._buffers = weakref.WeakSet()
+        # Bumped by reset_metrics so per-thread metrics lookups are invalidated
+        self._reset_epoch = 0
+        # Changed on every counter write; get_metrics reuses its last result until then.
+        # Values come from a shared counter so racing writers never restore an old epoch.
+        self._epoch_counter = itertools.count(1)
+        self._metrics_epoch = 0
+        self._metrics_cache = None
+        self._start_time = datetime.now().isoformat()
         
         # Initialize common operation types
         self._init_operation_types()
         
-        if self.logger_manager:
+        # Without a logger manager only counters are kept; every log message
+        # (and the string formatting behind it) is skipped.
+        self._log_enabled = self.logger_manager is not None
+        if self._log_enabled:
             self.logger = self.logger_manager.get_logger('performance_monitor')
             self.logger.info("Performance monitoring initialized")
     
@@ -76,148 +247,205 @@ class PerformanceMonitor:
         for op_type in operation_types:
             self._metrics[op_type] = PerformanceMetrics(operation_name=op_type)
     
-    def start_operation(self, operation_name: str, metadata: Optional[Dict[str, Any]] = None) -> str:
-        """Start timing an operation and return an operation ID."""
-        operation_id = str(uuid.uuid4())
-        start_time = time.perf_counter()
+    def _get_or_create_metrics(self, operation_name: str) -> PerformanceMetrics:
+        """Return the metrics entry for an operation, creating it if needed."""
+        buffer = self._thread_buffer()
+        if buffer.last_name == operation_name and buffer.reset_epoch == self._reset_epoch:
+            return buffer.last_metrics
         
+        # Single lock-free lookup; the lock is only needed to insert a new entry.
+        # The epoch is read first because reset_metrics bumps it after replacing entries.
+        epoch = self._reset_epoch
+        metrics = self._metrics.get(operation_name)
+        if metrics is None:
+            with self._lock:
+                metrics = self._metrics.get(operation_name)
+                if metrics is None:
+                    metrics = self._metrics[operation_name] = PerformanceMetrics(operation_name=operation_name)
+        
+        buffer.last_name = operation_name
+        buffer.last_metrics = metrics
+        buffer.reset_epoch = epoch
+        return metrics
+    
+    def _thread_buffer(self) -> _ThreadBuffer:
+        """Return the calling thread's buffer, installing it on first use."""
+        buffer = getattr(self._tls, 'buffer', None)
+        if buffer is None:
+            buffer = self._tls.buffer = _ThreadBuffer()
+            with self._lock:
+                self._buffers.add(buffer)
+            # Flush whatever is left when the thread exits (or at interpreter shutdown).
+            # A bound method here would let the finalizer registry keep the monitor alive.
+            weakref.finalize(buffer, _drain_on_exit, buffer.pending, weakref.ref(self))
+        return buffer
+    
+    def _record(self, metrics: PerformanceMetrics, duration_ns: int, success: bool,
+                error: Optional[tuple] = None):
+        """Queue a completed call in the thread-local buffer, flushing when due."""
+        buffer = self._thread_buffer()
+        buffer.pending.append((metrics, duration_ns, success, error))
+        
+        now = time.monotonic()
+        if len(buffer.pending) >= FLUSH_BATCH_SIZE or now - buffer.last_flush >= FLUSH_INTERVAL:
+            buffer.last_flush = now
+            self._drain(buffer.pending)
+    
+    def _drain(self, pending: deque):
+        """Apply all queued entries in ``pending`` to their metrics."""
+        batches: Dict[int, tuple] = {}
+        while True:
+            try:
+                metrics, duration_ns, success, error = pending.popleft()
+            except IndexError:
+                break
+            batch = batches.get(id(metrics))
+            if batch is None:
+                batch = batches[id(metrics)] = (metrics, [])
+            batch[1].append((duration_ns, success, error))
+        
+        for metrics, entries in batches.values():
+            with metrics._lock:
+                metrics.record_batch(entries)
+        if batches:
+            self._metrics_epoch = next(self._epoch_counter)
+    
+    def _flush_all(self):
+        """Flush the buffers of every live thread so reads are up to date."""
         with self._lock:
+            buffers = list(self._buffers)
+        for buffer in buffers:
+            self._drain(buffer.pending)
+    
+    def start_operation(self, operation_name: str, metadata: Optional[Dict[str, Any]] = None) -> int:
+        """Start timing an operation and return an operation ID."""
+        operation_id = self._next_operation_id()
+        start_time_ns = time.perf_counter_ns()
+        
+        with self._active_lock:
             self._active_operations[operation_id] = ActiveOperation(
                 operation_id=operation_id,
                 operation_name=operation_name,
-                start_time=start_time,
-                metadata=metadata or {}
+                start_time_ns=start_time_ns,
+                metadata=metadata if metadata is not None else _EMPTY_METADATA
             )
         
-        if self.logger_manager:
-            self.logger.debug(f"Started operation {operation_name} with ID {operation_id}")
+        if self._log_enabled:
+            self.logger.debug("Started operation %s with ID %s", operation_name, operation_id)
         
         return operation_id
     
-    def end_operation(self, operation_id: str, success: bool = True, error_message: Optional[str] = None):
+    def end_operation(self, operation_id: int, success: bool = True, error_message: Optional[str] = None):
         """End timing an operation and record the metrics."""
-        end_time = time.perf_counter()
+        end_time_ns = time.perf_counter_ns()
         
-        with self._lock:
-            if operation_id not in self._active_operations:
-                if self.logger_manager:
-                    self.logger.warning(f"Attempted to end unknown operation ID: {operation_id}")
-                return
-            
-            operation = self._active_operations.pop(operation_id)
-            duration = end_time - operation.start_time
-            
-            # Update metrics
-            if operation.operation_name not in self._metrics:
-                self._metrics[operation.operation_name] = PerformanceMetrics(operation_name=operation.operation_name)
-            metrics = self._metrics[operation.operation_name]
-            metrics.total_calls += 1
-            metrics.total_duration += duration
-            metrics.recent_durations.append(duration)
-            
-            if success:
-                metrics.success_count += 1
-            else:
-                metrics.error_count += 1
-                if error_message:
-                    metrics.recent_errors.append({
-                        'timestamp': datetime.now(),
-                        'error': error_message,
-                        'duration': duration
-                    })
-            
-            # Update 24h counter (simplified - in production, you'd want proper time-based tracking)
-            metrics.last_24h_calls += 1
-        
-        if self.logger_manager:
+        with self._active_lock:
+            operation = self._active_operations.pop(operation_id, None)
+        
+        if operation is None:
+            if self._log_enabled:
+                self.logger.warning("Attempted to end unknown operation ID: %s", operation_id)
+            return
+        
+        self._finish_operation(operation.operation_name, end_time_ns - operation.start_time_ns,
+                               success, error_message)
+    
+    @contextlib.contextmanager
+    def track(self, operation_name: str):
+        """Time the enclosed block as a single operation.
+        
+        Unlike :meth:`start_operation`/:meth:`end_operation` the operation is
+        never registered as active, so no ID is issued and no shared state is
+        touched until it completes. An exception escaping the block records a
+        failure with its message and is re-raised.
+        """
+        start_time_ns = time.perf_counter_ns()
+        try:
+            yield
+        except Exception as exc:
+            self._finish_operation(operation_name, time.perf_counter_ns() - start_time_ns, False, str(exc))
+            raise
+        self._finish_operation(operation_name, time.perf_counter_ns() - start_time_ns, True, None)
+    
+    def _finish_operation(self, operation_name: str, duration_ns: int, success: bool,
+                          error_message: Optional[str]):
+        """Record a completed timed operation."""
+        metrics = self._get_or_create_metrics(operation_name)
+        
+        error = None
+        if not success and error_message:
+            error = (time.time(), duration_ns / NS_PER_SECOND, error_message, None)
+        
+        self._record(metrics, duration_ns, success, error)
+        
+        if self._log_enabled:
             status = "SUCCESS" if success else "FAILED"
-            self.logger.info(f"Operation {operation.operation_name} {status} in {duration:.3f}s")
+            self.logger.info(OPERATION_LOG_TEMPLATE, operation_name, status, duration_ns / NS_PER_SECOND)
             if not success and error_message:
-                self.logger.error(f"Operation {operation.operation_name} failed: {error_message}")
+                self.logger.error(OPERATION_FAILED_TEMPLATE, operation_name, error_message)
     
     def log_ai_request(self, duration: float, success: bool, model_name: Optional[str] = None, 
                       error_message: Optional[str] = None):
         """Log an AI inference request with performance data."""
-        with self._lock:
-            if 'ai_inference' not in self._metrics:
-                self._metrics['ai_inference'] = PerformanceMetrics(operation_name='ai_inference')
-            metrics = self._metrics['ai_inference']
-            metrics.total_calls += 1
-            metrics.total_duration += duration
-            metrics.recent_durations.append(duration)
-            metrics.last_24h_calls += 1
-            
-            if success:
-                metrics.success_count += 1
-            else:
-                metrics.error_count += 1
-                if error_message:
-                    metrics.recent_errors.append({
-                        'timestamp': datetime.now(),
-                        'error': error_message,
-                        'duration': duration,
-                        'model': model_name
-                    })
-        
-        if self.logger_manager:
+        metrics = self._metrics['ai_inference']  # Seeded in _init_operation_types
+        error = None
+        if not success and error_message:
+            error = (time.time(), duration, error_message, ('model', model_name))
+        
+        self._record(metrics, int(duration * NS_PER_SECOND), success, error)
+        
+        if self._log_enabled:
             status = "SUCCESS" if success else "FAILED"
-            model_info = f" (model: {model_name})" if model_name else ""
-            self.logger.info(f"AI inference {status} in {duration:.3f}s{model_info}")
+            if model_name:
+                self.logger.info(AI_MODEL_LOG_TEMPLATE, status, duration, model_name)
+            else:
+                self.logger.info(AI_LOG_TEMPLATE, status, duration)
     
     def log_scan_operation(self, file_count: int, duration: float, directory_path: str):
         """Log a file scanning operation with performance data."""
-        files_per_second = file_count / duration if duration > 0 else 0
+        metrics = self._metrics['file_scan']  # Seeded in _init_operation_types
+        self._record(metrics, int(duration * NS_PER_SECOND), True)  # Assume scans that complete are successful
         
-        with self._lock:
-            if 'file_scan' not in self._metrics:
-                self._metrics['file_scan'] = PerformanceMetrics(operation_name='file_scan')
-            metrics = self._metrics['file_scan']
-            metrics.total_calls += 1
-            metrics.total_duration += duration
-            metrics.recent_durations.append(duration)
-            metrics.success_count += 1  # Assume scans that complete are successful
-            metrics.last_24h_calls += 1
-        
-        if self.logger_manager:
-            self.logger.info(f"File scan completed: {file_count} files in {duration:.3f}s "
-                           f"({files_per_second:.1f} files/sec) - Path: {directory_path}")
+        if self._log_enabled:
+            files_per_second = file_count / duration if duration > 0 else 0
+            self.logger.info(SCAN_LOG_TEMPLATE, file_count, duration, files_per_second, directory_path)
     
     def log_database_operation(self, operation_type: str, duration: float, affected_rows: int = 0,
                              success: bool = True, error_message: Optional[str] = None):
         """Log a database operation with performance data."""
-        with self._lock:
-            if 'database_query' not in self._metrics:
-                self._metrics['database_query'] = PerformanceMetrics(operation_name='database_query')
-            metrics = self._metrics['database_query']
-            metrics.total_calls += 1
-            metrics.total_duration += duration
-            metrics.recent_durations.append(duration)
-            metrics.last_24h_calls += 1
-            
-            if success:
-                metrics.success_count += 1
-            else:
-                metrics.error_count += 1
-                if error_message:
-                    metrics.recent_errors.append({
-                        'timestamp': datetime.now(),
-                        'error': error_message,
-                        'operation': operation_type,
-                        'duration': duration
-                    })
-        
-        if self.logger_manager:
+        metrics = self._metrics['database_query']  # Seeded in _init_operation_types
+        error = None
+        if not success and error_message:
+            error = (time.time(), duration, error_message, ('operation', operation_type))
+        
+        self._record(metrics, int(duration * NS_PER_SECOND), success, error)
+        
+        if self._log_enabled:
             status = "SUCCESS" if success else "FAILED"
-            rows_info = f" ({affected_rows} rows)" if affected_rows > 0 else ""
-            self.logger.info(f"Database {operation_type} {status} in {duration:.3f}s{rows_info}")
+            if affected_rows > 0:
+                self.logger.info(DB_ROWS_LOG_TEMPLATE, operation_type, status, duration, affected_rows)
+            else:
+                self.logger.info(DB_LOG_TEMPLATE, operation_type, status, duration)
     
-    def get_metrics(self) -> Dict[str, Any]:
-        """Get all performance metrics for display."""
+    def get_metrics(self) -> Mapping[str, Any]:
+        """Get all performance metrics for display (read-only, cached between writes)."""
+        self._flush_all()
+        
+        cache_key = (self._metrics_epoch, len(self._active_operations))
+        cached = self._metrics_cache
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+        
         with self._lock:
-            metrics_data = {}
-            
-            for operation_name, metrics in self._metrics.items():
+            entries = list(self._metrics.items())
+        
+        metrics_data = {}
+        used_types = 0
+        
+        for operation_name, metrics in entries:
+            with metrics._lock:
                 if metrics.total_calls > 0:  # Only include operations that have been used
+                    used_types += 1
                     metrics_data[operation_name] = {
                         'total_calls': metrics.total_calls,
                         'average_duration': metrics.average_duration,
@@ -225,26 +453,31 @@ class PerformanceMonitor:
                         'success_rate': metrics.success_rate,
                         'last_24h_calls': metrics.last_24h_calls,
                         'total_errors': metrics.error_count,
-                        'recent_errors': list(metrics.recent_errors)[-5:]  # Last 5 errors
+                        'recent_errors': metrics.recent_errors.latest(5)  # Last 5 errors
                     }
-            
-            # Add system-wide stats
-            metrics_data['_system'] = {
-                'active_operations': len(self._active_operations),
-                'total_operation_types': len([m for m in self._metrics.values() if m.total_calls > 0]),
-                'monitoring_start_time': datetime.now().isoformat()  # Simplified
-            }
-            
-            return metrics_data
+        
+        # Add system-wide stats
+        metrics_data['_system'] = {
+            'active_operations': cache_key[1],
+            'total_operation_types': used_types,
+            'monitoring_start_time': self._start_time
+        }
+        
+        result = MappingProxyType(metrics_data)
+        self._metrics_cache = (cache_key, result)
+        return result
     
     def get_operation_summary(self, operation_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed summary for a specific operation type."""
+        self._flush_all()
+        
         with self._lock:
-            if operation_name not in self._metrics:
-                return None
-            
-            metrics = self._metrics[operation_name]
-            
+            metrics = self._metrics.get(operation_name)
+        
+        if metrics is None:
+            return None
+        
+        with metrics._lock:
             return {
                 'operation_name': operation_name,
                 'total_calls': metrics.total_calls,
@@ -255,8 +488,8 @@ class PerformanceMonitor:
                 'success_count': metrics.success_count,
                 'error_count': metrics.error_count,
                 'last_24h_calls': metrics.last_24h_calls,
-                'recent_durations': list(metrics.recent_durations),
-                'recent_errors': list(metrics.recent_errors)
+                'recent_durations': [d / NS_PER_SECOND for d in metrics.recent_durations],
+                'recent_errors': metrics.recent_errors.latest()
             }
     
     def reset_metrics(self, operation_name: Optional[str] = None):
@@ -269,24 +502,29 @@ class PerformanceMonitor:
                 # Reset all metrics
                 for op_name in list(self._metrics.keys()):
                     self._metrics[op_name] = PerformanceMetrics(operation_name=op_name)
+            # Bumped after the swap so cached per-thread lookups never pair the new epoch with an old entry
+            self._reset_epoch += 1
+            self._metrics_epoch = next(self._epoch_counter)
         
-        if self.logger_manager:
+        if self._log_enabled:
             target = operation_name or "all operations"
-            self.logger.info(f"Performance metrics reset for {target}")
+            self.logger.info("Performance metrics reset for %s", target)
     
     def get_active_operations(self) -> List[Dict[str, Any]]:
         """Get list of currently active operations."""
-        with self._lock:
-            current_time = time.perf_counter()
-            active_ops = []
-            
-            for op_id, operation in self._active_operations.items():
-                elapsed = current_time - operation.start_time
-                active_ops.append({
-                    'operation_id': op_id,
-                    'operation_name': operation.operation_name,
-                    'elapsed_time': elapsed,
-                    'metadata': operation.metadata
-                })
-            
-            return active_ops
\ No newline at end of file
+        # Copy under the lock, build the result outside it so start/end aren't blocked
+        with self._active_lock:
+            snapshot = tuple(self._active_operations.values())
+        current_time_ns = time.perf_counter_ns()
+        
+        active_ops = []
+        for operation in snapshot:
+            elapsed = (current_time_ns - operation.start_time_ns) / NS_PER_SECOND
+            active_ops.append({
+                'operation_id': operation.operation_id,
+                'operation_name': operation.operation_name,
+                'elapsed_time': elapsed,
+                'metadata': operation.metadata
+            })
+        
+        return active_ops
\ No newline at end of file
@@ -1,22 +1,29 @@
 import sys
-import yaml
 from pathlib import Path
 
-from PyQt6.QtWidgets import QApplication
-
-from .db import DatabaseManager
-from .ui.main_window import MainWindow
-from .logging import LoggerManager, PerformanceMonitor, DebugInfoCollector
+USAGE = "usage: python -m sentinel.app.main [Qt options]\n\nLaunch the Sentinel Storage Analyzer GUI."
 
 
 def main() -> None:
     """Application entry point."""
+    # Handle quick-exit flags before paying for Qt, SQLAlchemy and the UI imports
+    if any(arg in ("-h", "--help") for arg in sys.argv[1:]):
+        print(USAGE)
+        return
+    
+    import yaml
+    from PyQt6.QtWidgets import QApplication
+    
+    from .db import DatabaseManager
+    from .ui.main_window import MainWindow
+    from .logging import LoggerManager, PerformanceMonitor, DebugInfoCollector
+    
     app = QApplication(sys.argv)
     
-    # Load configuration
+    # Load configuration (LibYAML's C loader when available)
     config_path = Path(__file__).parent.parent / 'config' / 'config.yaml'
     with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
     
     # Initialize logging system
     logger_manager = LoggerManager(config)
@@ -8,25 +8,49 @@ ENHANCED: Now uses the FastAgentOrchestrator for maximum performance!
 """
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List
+from typing import Callable, Iterable, Iterator, List
 
 from sentinel.app.core import FileMetadata, scan_directory, extract_content
-from sentinel.app.ai import InferenceEngine, InferenceResult, build_prompt
+from sentinel.app.ai import InferenceEngine, InferenceResult
 from sentinel.app.db import DatabaseManager
 from sentinel.app.config_manager import AppConfig
 
 # Import the enhanced agentic pipeline
 from sentinel.app.agentic_pipeline import run_agentic_analysis
 
+# Files are pulled from the scanner in batches; content extraction for a whole
+# batch is handed to a thread pool so disk reads overlap with inference.
+LEGACY_BATCH_SIZE = 32
+EXTRACTION_WORKERS = 4
+# Scan and inference rows are written to the database in bulk every N files.
+DB_BATCH_SIZE = 500
 
-def run_analysis(directory: str | Path, *, db: DatabaseManager, config: AppConfig, logger_manager=None, performance_monitor=None) -> List[dict]:
+
+def _batched(items: Iterable[FileMetadata], size: int) -> Iterator[List[FileMetadata]]:
+    """Yield successive lists of at most *size* items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def run_analysis(directory: str | Path, *, db: DatabaseManager, config: AppConfig, logger_manager=None, performance_monitor=None,
+                 cancel_cb: Callable[[], bool] | None = None,
+                 progress_cb: Callable[[int, int, str], None] | None = None) -> List[dict]:
     """Run full analysis over *directory* using the enhanced agentic system.
 
     Returns a list of dictionaries suitable for consumption by ReviewDialog.
     Each dict has keys: ``original_path``, ``suggested_path``, ``confidence``,
     and ``justification``.
 
+    If *cancel_cb* is given it is polled between units of work; once it
+    returns True the analysis stops early and returns the results so far.
+    If *progress_cb* is given it is called as ``progress_cb(processed, total,
+    current_file)`` after each file; *total* is 0 while it is not yet known.
+
     ENHANCED: Now uses FastAgentOrchestrator for massive performance improvements!
     - Processes thousands of files per second
     - Parallel agent execution
@@ -47,11 +71,13 @@ def run_analysis(directory: str | Path, *, db: DatabaseManager, config: AppConfi
             db=db, 
             config=config,
             logger_manager=logger_manager,
-            performance_monitor=performance_monitor
+            performance_monitor=performance_monitor,
+            cancel_cb=cancel_cb,
+            progress_cb=progress_cb
         )
         
         if logger:
-            successful = len([r for r in results if r.get('success', True)])
+            successful = sum(1 for r in results if r.get('success', True))
             logger.info(f"🎉 Enhanced pipeline completed: {successful}/{len(results)} files processed successfully")
         
         return results
@@ -61,10 +87,13 @@ def run_analysis(directory: str | Path, *, db: DatabaseManager, config: AppConfi
             logger.error(f"Enhanced pipeline failed, falling back to legacy mode: {e}")
         
         # Fallback to original implementation if agentic pipeline fails
-        return _run_legacy_analysis(directory, db=db, config=config, logger_manager=logger_manager, performance_monitor=performance_monitor)
+        return _run_legacy_analysis(directory, db=db, config=config, logger_manager=logger_manager, performance_monitor=performance_monitor,
+                                    cancel_cb=cancel_cb, progress_cb=progress_cb)
 
 
-def _run_legacy_analysis(directory: str | Path, *, db: DatabaseManager, config: AppConfig, logger_manager=None, performance_monitor=None) -> List[dict]:
+def _run_legacy_analysis(directory: str | Path, *, db: DatabaseManager, config: AppConfig, logger_manager=None, performance_monitor=None,
+                         cancel_cb: Callable[[], bool] | None = None,
+                         progress_cb: Callable[[int, int, str], None] | None = None) -> List[dict]:
     """Legacy analysis pipeline - fallback implementation."""
     results: list[dict] = []
     
@@ -85,50 +114,76 @@ def _run_legacy_analysis(directory: str | Path, *, db: DatabaseManager, config:
         )
 
         file_count = 0
-        for meta in scan_directory(directory):  # type: ignore[arg-type]
-            file_count += 1
-                
-            # Persist metadata first
-            file_id = db.save_scan_result(meta.as_dict())
-
-            try:
-                content = extract_content(meta.path)
-                prompt = build_prompt(meta.as_dict(), content)
-                inference: InferenceResult = engine.analyze(meta.as_dict(), content)  # type: ignore[arg-type]
-                    
-            except NotImplementedError:
-                # Placeholder inference – suggest same path
-                inference = InferenceResult(
-                    suggested_path=str(meta.path),
-                    confidence=0.5,
-                    justification="Backend not implemented",
+        pending_rows: list[tuple[dict, FileMetadata, InferenceResult]] = []
+
+        def flush_rows() -> None:
+            if not pending_rows:
+                return
+            start_time = time.perf_counter()
+            file_ids = db.save_scan_results_many([meta_dict for meta_dict, _, _ in pending_rows])
+            db.save_inferences_many(
+                (file_id, inference.as_dict()) for file_id, (_, _, inference) in zip(file_ids, pending_rows)
+            )
+            if performance_monitor:
+                performance_monitor.log_database_operation(
+                    'bulk_insert', time.perf_counter() - start_time, affected_rows=len(pending_rows)
                 )
-                    
-            except Exception as e:
-                # Handle other errors gracefully
-                inference = InferenceResult(
-                    suggested_path=str(meta.path),
-                    confidence=0.0,
-                    justification=f"Analysis failed: {str(e)}",
+
+            for file_id, (_, meta, inference) in zip(file_ids, pending_rows):
+                results.append(
+                    {
+                        "file_id": file_id,
+                        "original_path": str(meta.path),
+                        "suggested_path": inference.suggested_path,
+                        "confidence": inference.confidence,
+                        "justification": inference.justification,
+                    }
                 )
-                    
-            db.save_inference(file_id, inference.as_dict())
+            pending_rows.clear()
+
+        with ThreadPoolExecutor(max_workers=EXTRACTION_WORKERS) as pool:
+            for batch in _batched(scan_directory(directory), LEGACY_BATCH_SIZE):  # type: ignore[arg-type]
+                if cancel_cb is not None and cancel_cb():
+                    break
+                pending = [(meta, meta.as_dict(), pool.submit(extract_content, meta.path)) for meta in batch]
+
+                for meta, meta_dict, content_future in pending:
+                    file_count += 1
+
+                    try:
+                        content = content_future.result()
+                        inference: InferenceResult = engine.analyze(meta_dict, content)  # type: ignore[arg-type]
+
+                    except NotImplementedError:
+                        # Placeholder inference – suggest same path
+                        inference = InferenceResult(
+                            suggested_path=str(meta.path),
+                            confidence=0.5,
+                            justification="Backend not implemented",
+                        )
+
+                    except Exception as e:
+                        # Handle other errors gracefully
+                        inference = InferenceResult(
+                            suggested_path=str(meta.path),
+                            confidence=0.0,
+                            justification=f"Analysis failed: {str(e)}",
+                        )
+
+                    pending_rows.append((meta_dict, meta, inference))
+                    if progress_cb is not None:
+                        # The scanner streams files, so the total is unknown here
+                        progress_cb(file_count, 0, str(meta.path))
+                    if len(pending_rows) >= DB_BATCH_SIZE:
+                        flush_rows()
+
+        flush_rows()
 
-            results.append(
-                {
-                    "file_id": file_id,
-                    "original_path": str(meta.path),
-                    "suggested_path": inference.suggested_path,
-                    "confidence": inference.confidence,
-                    "justification": inference.justification,
-                }
-            )
-            
     except NotImplementedError:
         # If the very first call fails, fallback to stub scan
         from pathlib import Path as _P
 
-        for path in list(_P(directory).rglob("*"))[:100]:
+        for path in islice(_P(directory).rglob("*"), 100):
             results.append(
                 {
                     "file_id": -1,
@@ -1,16 +1,198 @@
 """Debug dialog for viewing logs and system information."""
 
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QTextEdit, 
-    QTableWidget, QTableWidgetItem, QPushButton, QLabel,
-    QScrollArea, QWidget, QSplitter, QHeaderView, QFileDialog,
-    QMessageBox, QProgressBar
+    QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QPlainTextEdit,
+    QTableView, QPushButton, QLabel, QWidget, QHeaderView, QFileDialog,
+    QMessageBox, QProgressBar, QComboBox
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool,
+    QSaveFile, QIODevice
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QTextCursor
 from datetime import datetime
-from pathlib import Path
-import json
+import math
+import time
+
+# Auto refresh backs off from the minimum towards the maximum while nothing changes
+MIN_REFRESH_INTERVAL_MS = 2000
+MAX_REFRESH_INTERVAL_MS = 30000
+REFRESH_INTERVAL_CHOICES = [
+    ("Auto", None),
+    ("2 s", 2000),
+    ("5 s", 5000),
+    ("10 s", 10000),
+    ("30 s", 30000),
+]
+# Oldest log lines beyond this are trimmed from the log pane
+MAX_LOG_LINES = 500
+# Debug reports are encoded and written to disk in chunks of this many bytes
+EXPORT_CHUNK_SIZE = 1 << 20
+# How long (seconds) collector results stay fresh in DebugDialog._cached
+STATIC_INFO_TTL = math.inf  # Platform details never change
+DISK_INFO_TTL = 30.0
+DYNAMIC_INFO_TTL = 2.0  # CPU, memory, log stats
+# The status probes log their own results; those lines don't count as activity
+PROBE_LOGGER_NAME = 'sentinel.debug_collector'
+
+
+class RowTableModel(QAbstractTableModel):
+    """Read-only table model backed by a list of row tuples.
+    
+    Rows may be shorter than the header; missing cells render empty.
+    """
+    
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._rows = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        return row[column] if column < len(row) else None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+    
+    def set_rows(self, rows, reset=False):
+        """Show *rows*, repainting only the block of cells whose text changed.
+        
+        A full model reset is done when *reset* is set or the row count or
+        shape changed. Returns True if anything visible changed.
+        """
+        rows = list(rows)
+        old_rows = self._rows
+        
+        if reset or len(rows) != len(old_rows):
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return rows != old_rows
+        
+        # Bounding box of the changed cells, emitted as a single dataChanged
+        top = left = None
+        bottom = right = -1
+        for row_index, (new_row, old_row) in enumerate(zip(rows, old_rows)):
+            if new_row == old_row:
+                continue
+            if len(new_row) != len(old_row):
+                # Cell layout changed (e.g. an error row); fall back to a reset
+                return self.set_rows(rows, reset=True)
+            for column, (new_value, old_value) in enumerate(zip(new_row, old_row)):
+                if new_value != old_value:
+                    if top is None:
+                        top = row_index
+                    bottom = row_index
+                    left = column if left is None else min(left, column)
+                    right = max(right, column)
+        
+        self._rows = rows
+        if top is None:
+            return False
+        
+        self.dataChanged.emit(
+            self.index(top, left), self.index(bottom, right), [Qt.ItemDataRole.DisplayRole]
+        )
+        return True
+
+
+class ProbeSignals(QObject):
+    """Signals used by StatusProbeTask to hand results back to the GUI thread."""
+    finished = pyqtSignal(str, dict)  # probe name, result
+
+
+class StatusProbeTask(QRunnable):
+    """Run a single debug collector probe on a thread pool."""
+    
+    def __init__(self, name, probe, signals):
+        super().__init__()
+        self.name = name
+        self.probe = probe
+        self.signals = signals
+    
+    def run(self):
+        try:
+            result = self.probe()
+        except Exception as e:
+            result = {'status': 'error', 'error': str(e)}
+        
+        try:
+            self.signals.finished.emit(self.name, result)
+        except RuntimeError:
+            pass  # Dialog was destroyed while the probe was running
+
+
+class ExportSignals(QObject):
+    """Signals used by ReportExportTask to report back to the GUI thread."""
+    finished = pyqtSignal(bool, str)  # success, file path or error message
+
+
+class SaveFileWriter:
+    """Minimal text file object that writes UTF-8 to a QSaveFile in large chunks."""
+    
+    def __init__(self, save_file, chunk_size=EXPORT_CHUNK_SIZE):
+        self.save_file = save_file
+        self.chunk_size = chunk_size
+        self._parts = []
+        self._pending = 0
+    
+    def write(self, text):
+        self._parts.append(text)
+        self._pending += len(text)
+        if self._pending >= self.chunk_size:
+            self.flush()
+        return len(text)
+    
+    def flush(self):
+        if not self._parts:
+            return
+        data = "".join(self._parts).encode('utf-8')
+        self._parts.clear()
+        self._pending = 0
+        if self.save_file.write(data) != len(data):
+            raise OSError(self.save_file.errorString())
+
+
+class ReportExportTask(QRunnable):
+    """Write a debug report to disk on a thread pool."""
+    
+    def __init__(self, debug_collector, file_path, signals):
+        super().__init__()
+        self.debug_collector = debug_collector
+        self.file_path = file_path
+        self.signals = signals
+    
+    def run(self):
+        # QSaveFile writes to a temporary file and only replaces the target on commit()
+        save_file = QSaveFile(self.file_path)
+        try:
+            if not save_file.open(QIODevice.OpenModeFlag.WriteOnly):
+                raise OSError(save_file.errorString())
+            writer = SaveFileWriter(save_file)
+            self.debug_collector.write_debug_report(writer)
+            writer.flush()
+            if not save_file.commit():
+                raise OSError(save_file.errorString())
+            success, message = True, self.file_path
+        except Exception as e:
+            save_file.cancelWriting()
+            success, message = False, str(e)
+        
+        try:
+            self.signals.finished.emit(success, message)
+        except RuntimeError:
+            pass  # Dialog was destroyed while the report was being written
 
 
 class DebugDialog(QDialog):
@@ -22,13 +204,37 @@ class DebugDialog(QDialog):
         self.performance_monitor = performance_monitor
         self.debug_collector = debug_collector
         
+        # (timestamp, message) of the newest log line already shown
+        self._last_log_key = None
+        
+        # Latest AI / database probe results, filled in by StatusProbeTask
+        self._probe_results = {}
+        self._probes_running = set()
+        self._probe_changed = False
+        self._probe_signals = ProbeSignals(self)
+        self._probe_signals.finished.connect(self.on_probe_finished)
+        
+        # {key: (expiry, value)} for slow collector calls, see _cached
+        self._collector_cache = {}
+        
+        # Unchanging parts of the system info text, built on first refresh
+        self._static_info_prefix = None
+        self._static_working_directory = None
+        self._system_info_lines = None  # Lines currently shown, for diffing
+        
+        self._export_signals = ExportSignals(self)
+        self._export_signals.finished.connect(self.on_export_finished)
+        
         self.setWindowTitle("Sentinel - Debug Information")
         self.setMinimumSize(800, 600)
         self.resize(1000, 700)
         
+        # One monospace font shared by the text panes
+        self._mono_font = QFont("Consolas", 9)
+        
         self.setup_ui()
         self.setup_auto_refresh()
-        self.refresh_all_data()
+        # Initial data is loaded by showEvent
     
     def setup_ui(self):
         """Set up the user interface."""
@@ -44,21 +250,43 @@ class DebugDialog(QDialog):
         self.create_performance_tab()
         self.create_system_info_tab()
         
+        # Refresh method per tab, in tab order; timer ticks only refresh the current tab
+        self._tab_refreshers = [
+            self.refresh_logs,
+            self.refresh_system_status,
+            self.refresh_performance_metrics,
+            self.refresh_system_info,
+        ]
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
+        
         # Create bottom buttons
         button_layout = QHBoxLayout()
         
         self.refresh_button = QPushButton("Refresh All")
-        self.refresh_button.clicked.connect(self.refresh_all_data)
+        self.refresh_button.clicked.connect(lambda: self.refresh_all_data(full=True))
         button_layout.addWidget(self.refresh_button)
         
         self.export_button = QPushButton("Export Debug Report")
         self.export_button.clicked.connect(self.export_debug_report)
         button_layout.addWidget(self.export_button)
         
+        self.export_progress = QProgressBar()
+        self.export_progress.setRange(0, 0)  # Busy indicator while the report is written
+        self.export_progress.setMaximumWidth(120)
+        self.export_progress.hide()
+        button_layout.addWidget(self.export_progress)
+        
         self.auto_refresh_button = QPushButton("Auto Refresh: ON")
         self.auto_refresh_button.clicked.connect(self.toggle_auto_refresh)
         button_layout.addWidget(self.auto_refresh_button)
         
+        self.refresh_interval_combo = QComboBox()
+        for label, interval_ms in REFRESH_INTERVAL_CHOICES:
+            self.refresh_interval_combo.addItem(label, interval_ms)
+        self.refresh_interval_combo.setToolTip("Auto refresh interval")
+        self.refresh_interval_combo.currentIndexChanged.connect(self.on_refresh_interval_changed)
+        button_layout.addWidget(self.refresh_interval_combo)
+        
         button_layout.addStretch()
         
         close_button = QPushButton("Close")
@@ -86,11 +314,12 @@ class DebugDialog(QDialog):
         
         layout.addLayout(controls_layout)
         
-        # Log display
-        self.log_text = QTextEdit()
+        # Log display (plain text: no rich-text layout per appended line)
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setFont(QFont("Consolas", 9))
+        self.log_text.setFont(self._mono_font)
         layout.addWidget(self.log_text)
+        self._log_scroll_bar = self.log_text.verticalScrollBar()
         
         self.tab_widget.addTab(logs_widget, "📋 Logs")
     
@@ -100,9 +329,15 @@ class DebugDialog(QDialog):
         layout = QVBoxLayout(status_widget)
         
         # Status indicators
-        self.status_table = QTableWidget(0, 3)
-        self.status_table.setHorizontalHeaderLabels(["Component", "Status", "Details"])
-        self.status_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.status_model = RowTableModel(["Component", "Status", "Details"], self)
+        self.status_table = QTableView()
+        self.status_table.setModel(self.status_model)
+        # Fixed default widths; content-based sizing would measure every cell
+        header = self.status_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setDefaultSectionSize(140)
+        header.resizeSection(0, 240)
+        header.setStretchLastSection(True)
         layout.addWidget(self.status_table)
         
         self.tab_widget.addTab(status_widget, "🔍 System Status")
@@ -113,12 +348,18 @@ class DebugDialog(QDialog):
         layout = QVBoxLayout(perf_widget)
         
         # Performance metrics table
-        self.perf_table = QTableWidget(0, 6)
-        self.perf_table.setHorizontalHeaderLabels([
+        self.perf_model = RowTableModel([
             "Operation", "Total Calls", "Avg Duration (s)", 
             "Success Rate (%)", "24h Calls", "Recent Errors"
-        ])
-        self.perf_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        ], self)
+        self.perf_table = QTableView()
+        self.perf_table.setModel(self.perf_model)
+        # Fixed default widths; content-based sizing would measure every cell
+        header = self.perf_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setDefaultSectionSize(140)
+        header.resizeSection(0, 240)
+        header.setStretchLastSection(True)
         layout.addWidget(self.perf_table)
         
         self.tab_widget.addTab(perf_widget, "📊 Performance")
@@ -129,19 +370,40 @@ class DebugDialog(QDialog):
         layout = QVBoxLayout(info_widget)
         
         # System info display
-        self.system_info_text = QTextEdit()
+        self.system_info_text = QPlainTextEdit()
         self.system_info_text.setReadOnly(True)
-        self.system_info_text.setFont(QFont("Consolas", 9))
+        self.system_info_text.setFont(self._mono_font)
         layout.addWidget(self.system_info_text)
+        self._info_cursor = QTextCursor(self.system_info_text.document())
         
         self.tab_widget.addTab(info_widget, "💻 System Info")
     
     def setup_auto_refresh(self):
         """Set up automatic refresh timer."""
         self.auto_refresh_timer = QTimer()
-        self.auto_refresh_timer.timeout.connect(self.refresh_all_data)
-        self.auto_refresh_enabled = True
-        self.auto_refresh_timer.start(5000)  # Refresh every 5 seconds
+        self.auto_refresh_timer.timeout.connect(self.on_auto_refresh_tick)
+        self.auto_refresh_enabled = True  # Timer runs only while shown (see showEvent)
+        self._refresh_interval_ms = MIN_REFRESH_INTERVAL_MS
+        self._pinned_interval_ms = None  # None means adaptive
+        self.auto_refresh_timer.setInterval(self._refresh_interval_ms)
+    
+    def on_auto_refresh_tick(self):
+        """Refresh and adapt the interval: back off while idle, reset on change."""
+        changed = self.refresh_current_tab()
+        if self._pinned_interval_ms is not None:
+            return
+        
+        if changed:
+            self._refresh_interval_ms = MIN_REFRESH_INTERVAL_MS
+        else:
+            self._refresh_interval_ms = min(self._refresh_interval_ms * 2, MAX_REFRESH_INTERVAL_MS)
+        self.auto_refresh_timer.setInterval(self._refresh_interval_ms)
+    
+    def on_refresh_interval_changed(self, index):
+        """Pin the auto refresh interval, or return to adaptive mode."""
+        self._pinned_interval_ms = self.refresh_interval_combo.itemData(index)
+        self._refresh_interval_ms = self._pinned_interval_ms or MIN_REFRESH_INTERVAL_MS
+        self.auto_refresh_timer.setInterval(self._refresh_interval_ms)
     
     def toggle_auto_refresh(self):
         """Toggle automatic refresh on/off."""
@@ -150,194 +412,316 @@ class DebugDialog(QDialog):
             self.auto_refresh_enabled = False
             self.auto_refresh_button.setText("Auto Refresh: OFF")
         else:
-            self.auto_refresh_timer.start(5000)
+            self.auto_refresh_timer.start()
             self.auto_refresh_enabled = True
             self.auto_refresh_button.setText("Auto Refresh: ON")
     
-    def refresh_all_data(self):
-        """Refresh all displayed data."""
-        self.refresh_logs()
-        self.refresh_system_status()
-        self.refresh_performance_metrics()
+    def _cached(self, key, ttl, fn):
+        """Return fn()'s result, reusing the previous one for ttl seconds."""
+        now = time.monotonic()
+        entry = self._collector_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        value = fn()
+        self._collector_cache[key] = (now + ttl, value)
+        return value
+    
+    def on_tab_changed(self, index):
+        """Bring the newly selected tab up to date."""
+        self.refresh_current_tab()
+    
+    def refresh_current_tab(self):
+        """Refresh only the visible tab; returns True if its contents changed."""
+        if not self.isVisible() or self.isMinimized():
+            return False
+        return bool(self._tab_refreshers[self.tab_widget.currentIndex()]())
+    
+    def refresh_all_data(self, full=False):
+        """Refresh all displayed data; *full* rebuilds the tables from scratch.
+        
+        Returns True if the logs or tables changed.
+        """
+        # Nothing to do while the user can't see the dialog
+        if not self.isVisible() or self.isMinimized():
+            return False
+        
+        changed = self.refresh_logs()
+        changed = self.refresh_system_status(full) or changed
+        changed = self.refresh_performance_metrics(full) or changed
         self.refresh_system_info()
+        return changed
     
     def refresh_logs(self):
-        """Refresh the logs display."""
+        """Refresh the logs display; returns True if new non-probe lines arrived."""
         if not self.logger_manager:
-            self.log_text.setText("Logger manager not available")
-            return
+            self.log_text.setPlainText("Logger manager not available")
+            return False
         
         try:
             recent_logs = self.logger_manager.get_recent_logs(100)
             
-            log_text = ""
-            for log_entry in recent_logs:
-                timestamp = log_entry.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                log_line = f"{timestamp} - {log_entry.level} - {log_entry.logger_name} - {log_entry.message}\n"
-                log_text += log_line
+            # Only append entries newer than the last one already displayed
+            new_logs = recent_logs
+            if self._last_log_key is not None:
+                for index in range(len(recent_logs) - 1, -1, -1):
+                    log_entry = recent_logs[index]
+                    if (log_entry.timestamp, log_entry.message) == self._last_log_key:
+                        new_logs = recent_logs[index + 1:]
+                        break
             
-            self.log_text.setText(log_text)
-            
-            # Scroll to bottom
-            cursor = self.log_text.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-            self.log_text.setTextCursor(cursor)
+            if new_logs:
+                lines = [
+                    f"{log_entry.timestamp.isoformat(sep=' ', timespec='seconds')} - {log_entry.level} - "
+                    f"{log_entry.logger_name} - {log_entry.message}"
+                    for log_entry in new_logs
+                ]
+                
+                # Keep the user's scroll position unless they were following the tail
+                scroll_bar = self._log_scroll_bar
+                at_bottom = scroll_bar.value() == scroll_bar.maximum()
+                self.log_text.appendPlainText("\n".join(lines))
+                self.trim_log_text()
+                if at_bottom:
+                    scroll_bar.setValue(scroll_bar.maximum())
+                
+                last_entry = new_logs[-1]
+                self._last_log_key = (last_entry.timestamp, last_entry.message)
             
-            self.log_count_label.setText(f"Showing last {len(recent_logs)} entries")
+            self.log_count_label.setText(f"Showing last {self.log_text.blockCount()} entries")
+            return any(log_entry.logger_name != PROBE_LOGGER_NAME for log_entry in new_logs)
             
         except Exception as e:
-            self.log_text.setText(f"Error loading logs: {e}")
+            self.log_text.setPlainText(f"Error loading logs: {e}")
+            self._last_log_key = None
+            return True
     
-    def refresh_system_status(self):
-        """Refresh the system status display."""
-        if not self.debug_collector:
-            self.status_table.setRowCount(1)
-            self.status_table.setItem(0, 0, QTableWidgetItem("Debug Collector"))
-            self.status_table.setItem(0, 1, QTableWidgetItem("❌ Not Available"))
-            self.status_table.setItem(0, 2, QTableWidgetItem("Debug collector not initialized"))
+    def trim_log_text(self):
+        """Drop the oldest log lines beyond MAX_LOG_LINES in a single erase."""
+        document = self.log_text.document()
+        excess = document.blockCount() - MAX_LOG_LINES
+        if excess <= 0:
             return
         
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.NextBlock, QTextCursor.MoveMode.KeepAnchor, excess)
+        cursor.removeSelectedText()
+    
+    def refresh_system_status(self, full=False):
+        """Refresh the system status display; returns True if any cell changed."""
+        if not self.debug_collector:
+            return self.status_model.set_rows([
+                ("Debug Collector", "❌ Not Available", "Debug collector not initialized")
+            ])
+        
+        # Probes may block on network or disk, so they report back asynchronously
+        self.start_status_probes()
+        
+        changed = self.update_status_rows(full) or self._probe_changed
+        self._probe_changed = False
+        return changed
+    
+    def start_status_probes(self):
+        """Dispatch the AI and database probes to the global thread pool."""
+        probes = (
+            ('ai', self.debug_collector.test_ai_connectivity),
+            ('database', self.debug_collector.test_database_connectivity),
+        )
+        pool = QThreadPool.globalInstance()
+        for name, probe in probes:
+            if name in self._probes_running:
+                continue  # Previous probe still in flight
+            self._probes_running.add(name)
+            pool.start(StatusProbeTask(name, probe, self._probe_signals))
+    
+    def on_probe_finished(self, name, result):
+        """Merge a probe result into the status table."""
+        self._probes_running.discard(name)
+        self._probe_results[name] = result
+        if self.update_status_rows():
+            self._probe_changed = True
+    
+    def update_status_rows(self, full=False):
+        """Rebuild the status rows from the latest probe results."""
+        rows = []
         try:
-            # Test AI connectivity
-            ai_status = self.debug_collector.test_ai_connectivity()
-            
-            # Test database connectivity
-            db_status = self.debug_collector.test_database_connectivity()
-            
-            # Get application state
-            app_state = self.debug_collector.collect_app_state()
-            
-            # Clear and populate table
-            self.status_table.setRowCount(0)
-            
             # AI Backend Status
-            ai_icon = "✅" if ai_status['status'] == 'connected' else "❌"
-            ai_details = f"Response time: {ai_status.get('response_time_ms', 'N/A')}ms"
-            if ai_status.get('error'):
-                ai_details += f" | Error: {ai_status['error']}"
-            
-            self.add_status_row("AI Backend", f"{ai_icon} {ai_status['status'].title()}", ai_details)
+            ai_status = self._probe_results.get('ai')
+            if ai_status is None:
+                rows.append(("AI Backend", "⏳ Checking...", ""))
+            else:
+                ai_icon = "✅" if ai_status['status'] == 'connected' else "❌"
+                ai_details = f"Response time: {ai_status.get('response_time_ms', 'N/A')}ms"
+                if ai_status.get('error'):
+                    ai_details += f" | Error: {ai_status['error']}"
+                
+                rows.append(("AI Backend", f"{ai_icon} {ai_status['status'].title()}", ai_details))
             
             # Database Status
-            db_icon = "✅" if db_status['status'] == 'connected' else "❌"
-            db_details = f"Tables: {db_status.get('table_count', 0)} | Size: {db_status.get('file_size_mb', 0):.2f}MB"
-            if db_status.get('error'):
-                db_details += f" | Error: {db_status['error']}"
-            
-            self.add_status_row("Database", f"{db_icon} {db_status['status'].title()}", db_details)
+            db_status = self._probe_results.get('database')
+            if db_status is None:
+                rows.append(("Database", "⏳ Checking...", ""))
+            else:
+                db_icon = "✅" if db_status['status'] == 'connected' else "❌"
+                db_details = f"Tables: {db_status.get('table_count', 0)} | Size: {db_status.get('file_size_mb', 0):.2f}MB"
+                if db_status.get('error'):
+                    db_details += f" | Error: {db_status['error']}"
+                
+                rows.append(("Database", f"{db_icon} {db_status['status'].title()}", db_details))
             
             # Logging System
             if self.logger_manager:
-                log_stats = self.logger_manager.get_log_stats()
+                log_stats = self._cached('log_stats', DYNAMIC_INFO_TTL, self.logger_manager.get_log_stats)
                 log_details = f"Level: {log_stats['current_level']} | Loggers: {log_stats['total_loggers']}"
-                self.add_status_row("Logging System", "✅ Active", log_details)
+                rows.append(("Logging System", "✅ Active", log_details))
             
             # Performance Monitoring
             if self.performance_monitor:
                 metrics = self.performance_monitor.get_metrics()
                 active_ops = self.performance_monitor.get_active_operations()
                 perf_details = f"Tracked operations: {len(metrics)} | Active: {len(active_ops)}"
-                self.add_status_row("Performance Monitor", "✅ Active", perf_details)
+                rows.append(("Performance Monitor", "✅ Active", perf_details))
             
         except Exception as e:
-            self.add_status_row("System Status", "❌ Error", f"Failed to collect status: {e}")
-    
-    def add_status_row(self, component, status, details):
-        """Add a row to the status table."""
-        row = self.status_table.rowCount()
-        self.status_table.insertRow(row)
-        self.status_table.setItem(row, 0, QTableWidgetItem(component))
-        self.status_table.setItem(row, 1, QTableWidgetItem(status))
-        self.status_table.setItem(row, 2, QTableWidgetItem(details))
-    
-    def refresh_performance_metrics(self):
-        """Refresh the performance metrics display."""
+            rows.append(("System Status", "❌ Error", f"Failed to collect status: {e}"))
+        
+        return self.update_table(self.status_table, self.status_model, rows, full)
+    
+    def update_table(self, view, model, rows, full=False):
+        """Apply rows to a table model with the view's repaints held until done."""
+        view.setUpdatesEnabled(False)
+        try:
+            return model.set_rows(rows, reset=full)
+        finally:
+            view.setUpdatesEnabled(True)
+    
+    def refresh_performance_metrics(self, full=False):
+        """Refresh the performance metrics display; returns True if any cell changed."""
         if not self.performance_monitor:
-            self.perf_table.setRowCount(1)
-            self.perf_table.setItem(0, 0, QTableWidgetItem("Performance Monitor"))
-            self.perf_table.setItem(0, 1, QTableWidgetItem("Not Available"))
-            return
+            return self.perf_model.set_rows([("Performance Monitor", "Not Available")])
         
+        rows = []
         try:
             metrics = self.performance_monitor.get_metrics()
-            
-            # Clear table
-            self.perf_table.setRowCount(0)
+            append_row = rows.append  # Bound once; this loop runs every tick
             
             for operation_name, data in metrics.items():
-                if operation_name.startswith('_'):  # Skip system metrics
+                if operation_name[:1] == '_':  # Skip system metrics
                     continue
                 
-                row = self.perf_table.rowCount()
-                self.perf_table.insertRow(row)
-                
-                self.perf_table.setItem(row, 0, QTableWidgetItem(operation_name))
-                self.perf_table.setItem(row, 1, QTableWidgetItem(str(data['total_calls'])))
-                self.perf_table.setItem(row, 2, QTableWidgetItem(f"{data['average_duration']:.3f}"))
-                self.perf_table.setItem(row, 3, QTableWidgetItem(f"{data['success_rate']:.1f}"))
-                self.perf_table.setItem(row, 4, QTableWidgetItem(str(data['last_24h_calls'])))
+                calls, average, rate, last_24h = (
+                    data['total_calls'], data['average_duration'],
+                    data['success_rate'], data['last_24h_calls']
+                )
                 
                 # Recent errors
-                error_count = len(data.get('recent_errors', []))
-                error_text = f"{error_count} errors" if error_count > 0 else "None"
-                self.perf_table.setItem(row, 5, QTableWidgetItem(error_text))
+                error_count = len(data.get('recent_errors', ()))
+                error_text = f"{error_count} errors" if error_count else "None"
+                
+                append_row((
+                    operation_name,
+                    str(calls),
+                    f"{average:.3f}",
+                    f"{rate:.1f}",
+                    str(last_24h),
+                    error_text
+                ))
                 
         except Exception as e:
-            row = self.perf_table.rowCount()
-            self.perf_table.insertRow(row)
-            self.perf_table.setItem(row, 0, QTableWidgetItem("Error"))
-            self.perf_table.setItem(row, 1, QTableWidgetItem(str(e)))
+            rows.append(("Error", str(e)))
+        
+        return self.update_table(self.perf_table, self.perf_model, rows, full)
+    
+    def build_static_system_info(self):
+        """Format the system info fields that never change."""
+        platform = self._cached('platform', STATIC_INFO_TTL, self.debug_collector.collect_platform_info)
+        app_state = self.debug_collector.collect_app_state()
+        
+        self._static_info_prefix = (
+            "=== SYSTEM INFORMATION ===\n\n"
+            f"System: {platform.get('system')} {platform.get('release')}\n"
+            f"Architecture: {platform.get('machine')}\n"
+            f"Python: {platform.get('python_version', '').split()[0]}\n\n"
+        )
+        self._static_working_directory = app_state.get('application', {}).get('working_directory')
     
     def refresh_system_info(self):
-        """Refresh the system information display."""
+        """Refresh the system information display; returns True if any line changed."""
         if not self.debug_collector:
-            self.system_info_text.setText("Debug collector not available")
-            return
+            self.system_info_text.setPlainText("Debug collector not available")
+            self._system_info_lines = None
+            return False
         
         try:
-            system_info = self.debug_collector.collect_system_info()
-            app_state = self.debug_collector.collect_app_state()
+            if self._static_info_prefix is None:
+                self.build_static_system_info()
             
-            # Format system information
-            info_text = "=== SYSTEM INFORMATION ===\n\n"
-            
-            # Platform info
-            platform = system_info.get('platform', {})
-            info_text += f"System: {platform.get('system')} {platform.get('release')}\n"
-            info_text += f"Architecture: {platform.get('machine')}\n"
-            info_text += f"Python: {platform.get('python_version', '').split()[0]}\n\n"
+            collector = self.debug_collector
+            hardware = self._cached(
+                'hardware', DYNAMIC_INFO_TTL, lambda: collector.collect_hardware_info(cpu_interval=None)
+            )
+            disk = self._cached('disk', DISK_INFO_TTL, collector.collect_disk_usage)
             
             # Hardware info
-            hardware = system_info.get('hardware', {})
-            info_text += f"CPU Cores: {hardware.get('cpu_count')}\n"
-            info_text += f"CPU Usage: {hardware.get('cpu_percent')}%\n"
-            info_text += f"Memory: {hardware.get('memory_available_gb'):.1f}GB / {hardware.get('memory_total_gb'):.1f}GB\n"
-            info_text += f"Memory Usage: {hardware.get('memory_percent')}%\n\n"
+            dynamic_lines = [
+                f"CPU Cores: {hardware.get('cpu_count')}\n",
+                f"CPU Usage: {hardware.get('cpu_percent')}%\n",
+                f"Memory: {hardware.get('memory_available_gb'):.1f}GB / {hardware.get('memory_total_gb'):.1f}GB\n",
+                f"Memory Usage: {hardware.get('memory_percent')}%\n\n",
+            ]
             
             # Disk usage
-            disk = hardware.get('disk_usage', {})
-            if disk:
-                info_text += f"Disk: {disk.get('free_gb'):.1f}GB free / {disk.get('total_gb'):.1f}GB total\n"
-                info_text += f"Disk Usage: {disk.get('percent')}%\n\n"
+            if disk and 'error' not in disk:
+                dynamic_lines.append(f"Disk: {disk.get('free_gb'):.1f}GB free / {disk.get('total_gb'):.1f}GB total\n")
+                dynamic_lines.append(f"Disk Usage: {disk.get('percent')}%\n\n")
             
-            # Application info
-            info_text += "=== APPLICATION STATE ===\n\n"
-            config = app_state.get('configuration', {})
-            info_text += f"AI Backend: {config.get('ai_backend_mode')}\n"
-            info_text += f"Database: {config.get('database_path')}\n"
-            info_text += f"Working Directory: {app_state.get('application', {}).get('working_directory')}\n\n"
+            # Application info (config can change at runtime via Settings)
+            config = collector.config or {}
+            dynamic_lines.append("=== APPLICATION STATE ===\n\n")
+            dynamic_lines.append(f"AI Backend: {config.get('ai_backend_mode', 'unknown')}\n")
+            dynamic_lines.append(f"Database: {config.get('database_path', 'unknown')}\n")
+            dynamic_lines.append(f"Working Directory: {self._static_working_directory}\n\n")
             
             # Logging info
-            if 'logging' in app_state:
-                logging_info = app_state['logging']
-                info_text += f"Log Level: {logging_info.get('current_level')}\n"
-                info_text += f"Log File: {logging_info.get('log_file_path')}\n"
-                info_text += f"Log File Size: {logging_info.get('log_file_size_mb', 0):.2f}MB\n"
+            if self.logger_manager:
+                logging_info = self._cached('log_stats', DYNAMIC_INFO_TTL, self.logger_manager.get_log_stats)
+                dynamic_lines.append(f"Log Level: {logging_info.get('current_level')}\n")
+                dynamic_lines.append(f"Log File: {logging_info.get('log_file_path')}\n")
+                dynamic_lines.append(f"Log File Size: {logging_info.get('log_file_size_mb', 0):.2f}MB\n")
             
-            self.system_info_text.setText(info_text)
+            return self.set_system_info_text(self._static_info_prefix + "".join(dynamic_lines))
             
         except Exception as e:
-            self.system_info_text.setText(f"Error loading system information: {e}")
+            self.system_info_text.setPlainText(f"Error loading system information: {e}")
+            self._system_info_lines = None
+            return True
+    
+    def set_system_info_text(self, text):
+        """Show text, editing only the lines that differ; returns True if any did."""
+        lines = text.split("\n")
+        old_lines = self._system_info_lines
+        self._system_info_lines = lines
+        if old_lines is None or len(old_lines) != len(lines):
+            self.system_info_text.setPlainText(text)
+            return True
+        
+        document = self.system_info_text.document()
+        cursor = self._info_cursor
+        editing = False
+        for number, (old_line, line) in enumerate(zip(old_lines, lines)):
+            if old_line == line:
+                continue
+            
+            if not editing:
+                cursor.beginEditBlock()
+                editing = True
+            cursor.setPosition(document.findBlockByNumber(number).position())
+            cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+            cursor.insertText(line)
+        
+        if editing:
+            cursor.endEditBlock()
+        return editing
     
     def clear_log_display(self):
         """Clear the log display."""
@@ -350,30 +734,54 @@ class DebugDialog(QDialog):
             QMessageBox.warning(self, "Export Error", "Debug collector not available")
             return
         
+        # Ask user for save location; no auto refresh while the modal dialog is up
+        self.auto_refresh_timer.stop()
         try:
-            # Generate debug report
-            debug_report = self.debug_collector.generate_debug_report()
-            
-            # Ask user for save location
             file_path, _ = QFileDialog.getSaveFileName(
                 self,
                 "Save Debug Report",
                 f"sentinel_debug_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                 "JSON Files (*.json);;All Files (*)"
             )
-            
-            if file_path:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(debug_report)
-                
-                QMessageBox.information(
-                    self, 
-                    "Export Successful", 
-                    f"Debug report exported to:\n{file_path}"
-                )
+        finally:
+            if self.auto_refresh_enabled and self.isVisible():
+                self.auto_refresh_timer.start()
         
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export debug report:\n{e}")
+        if not file_path:
+            return
+        
+        # Generate and write the report off the GUI thread
+        self.export_button.setEnabled(False)
+        self.export_progress.show()
+        QThreadPool.globalInstance().start(
+            ReportExportTask(self.debug_collector, file_path, self._export_signals)
+        )
+    
+    def on_export_finished(self, success, message):
+        """Report the outcome of a background export."""
+        self.export_progress.hide()
+        self.export_button.setEnabled(True)
+        
+        if success:
+            QMessageBox.information(
+                self, 
+                "Export Successful", 
+                f"Debug report exported to:\n{message}"
+            )
+        else:
+            QMessageBox.critical(self, "Export Error", f"Failed to export debug report:\n{message}")
+    
+    def showEvent(self, event):
+        """Refresh immediately and resume auto refresh when shown."""
+        super().showEvent(event)
+        self.refresh_all_data()
+        if self.auto_refresh_enabled:
+            self.auto_refresh_timer.start()
+    
+    def hideEvent(self, event):
+        """Pause auto refresh while hidden."""
+        self.auto_refresh_timer.stop()
+        super().hideEvent(event)
     
     def closeEvent(self, event):
         """Handle dialog close event."""
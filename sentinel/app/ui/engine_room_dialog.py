@@ -4,25 +4,29 @@ Sentinel 2.0 - Engine Room Dashboard
 The revolutionary transparency UI that shows users exactly how their system works
 """
 
+import functools
+import random
 import sys
+import time
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QGroupBox, QWidget, QScrollArea,
-    QProgressBar, QTextEdit, QComboBox, QLineEdit,
-    QSplitter, QTabWidget, QFrame
+    QProgressBar, QPlainTextEdit, QComboBox, QLineEdit,
+    QSplitter, QTabWidget, QFrame, QFileDialog, QMessageBox
 )
-from PyQt6.QtGui import QFont, QPalette, QColor
+from PyQt6.QtGui import QFont, QPalette, QColor, QTextCharFormat
 from PyQt6.QtCore import QPropertyAnimation, QEasingCurve
 
 # Add sentinel to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerMetrics:
     """Real-time metrics for a worker process."""
     worker_id: str
@@ -38,7 +42,7 @@ class WorkerMetrics:
     last_updated: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemMetrics:
     """Overall system performance metrics."""
     total_throughput: float
@@ -52,17 +56,140 @@ class SystemMetrics:
     current_bottleneck: str
 
 
+# Log entries kept in memory, and lines kept in the log viewer display
+MAX_LOG_ENTRIES = 1000
+MAX_DISPLAYED_LOG_LINES = 100
+# Delay after the last filter/search change before the log view is re-filtered
+FILTER_DEBOUNCE_MS = 120
+
+# Mock data choices for the demonstration mode
+MOCK_STATUSES = ('idle', 'processing', 'waiting')
+MOCK_BOTTLENECKS = ('None', 'CPU', 'GPU Memory', 'Storage')
+MOCK_LOG_LEVELS = ('INFO', 'DEBUG', 'WARNING')
+MOCK_LOG_MESSAGES = (
+    "Processed batch of 32 files",
+    "GPU memory usage at 78%",
+    "Batch processing completed",
+    "Worker ready for next batch",
+    "Performance optimization applied"
+)
+
+# Card colors per worker status
+WORKER_STATUS_STYLES = {
+    'idle': {
+        'background': '#FFF3E0',
+        'border': '#FF9800'
+    },
+    'processing': {
+        'background': '#E8F5E8',
+        'border': '#4CAF50'
+    },
+    'waiting': {
+        'background': '#FFF8E1',
+        'border': '#FFC107'
+    },
+    'error': {
+        'background': '#FFEBEE',
+        'border': '#F44336'
+    }
+}
+
+
+class WorkerMetricsBoard:
+    """Latest metrics per worker, written by worker threads and read by the UI.
+    
+    Each worker owns one slot (single writer) and publishes by storing its
+    WorkerMetrics there and bumping the slot's version. Both are plain
+    reference stores, so producers never lock and the UI reads every slot
+    without contending with them; at worst it sees a snapshot one tick old.
+    Producers on other threads should publish a fresh WorkerMetrics each
+    time; a producer on the UI thread may mutate and republish one instance.
+    """
+    
+    def __init__(self):
+        self._slots: Dict[str, Optional[WorkerMetrics]] = {}
+        self._versions: Dict[str, int] = {}
+    
+    def register(self, worker_id: str):
+        """Create a worker's slot; call before its thread starts publishing."""
+        self._slots.setdefault(worker_id, None)
+        self._versions.setdefault(worker_id, 0)
+    
+    def publish(self, worker_id: str, metrics: WorkerMetrics):
+        """Store a registered worker's latest metrics (single writer per slot)."""
+        self._slots[worker_id] = metrics
+        self._versions[worker_id] += 1
+    
+    def snapshot(self) -> List[Tuple[str, int, WorkerMetrics]]:
+        """Return (worker_id, version, metrics) for every worker that has published."""
+        versions = self._versions
+        return [
+            (worker_id, versions[worker_id], metrics)
+            for worker_id, metrics in list(self._slots.items())
+            if metrics is not None
+        ]
+
+
+# Rendered values repeat a lot ("0 fps", "GPU: 85%"), so reuse the strings
+@functools.lru_cache(maxsize=256)
+def _fmt_fps(files_per_second: int) -> str:
+    return f"{files_per_second} fps"
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_usage(resource: str, percent: int) -> str:
+    return f"{resource}: {percent}%"
+
+
+def _set_if_changed(label: QLabel, text: str):
+    """Set a label's text only if it differs, avoiding a needless relayout/repaint."""
+    if label.text() != text:
+        label.setText(text)
+
+
 class WorkerCard(QWidget):
     """Individual worker process visualization card."""
     
+    _STATUS_ICONS = {
+        'idle': '🟡 Idle',
+        'processing': '🟢 Processing',
+        'waiting': '🟡 Waiting',
+        'error': '🔴 Error'
+    }
+    
+    _header_font: Optional[QFont] = None
+    
+    # Stylesheets are formatted once; setStyleSheet repolishes the whole card
+    _QSS_BY_STATUS: Dict[str, str] = {
+        status: f"""
+            QWidget {{
+                background-color: {style['background']};
+                border: 2px solid {style['border']};
+                border-radius: 8px;
+            }}
+        """
+        for status, style in WORKER_STATUS_STYLES.items()
+    }
+    
     def __init__(self, worker_id: str, parent=None):
         super().__init__(parent)
         self.worker_id = worker_id
         self.current_metrics: Optional[WorkerMetrics] = None
+        self._applied_status: Optional[str] = None
         
         self.setup_ui()
         self.setFixedSize(200, 150)
     
+    @classmethod
+    def header_font(cls) -> QFont:
+        """Header font shared by all cards, created on first use (after QApplication)."""
+        if cls._header_font is None:
+            header_font = QFont()
+            header_font.setBold(True)
+            header_font.setPointSize(10)
+            cls._header_font = header_font
+        return cls._header_font
+    
     def setup_ui(self):
         """Setup the worker card UI."""
         layout = QVBoxLayout(self)
@@ -71,10 +198,7 @@ class WorkerCard(QWidget):
         
         # Worker header
         self.header_label = QLabel(self.worker_id)
-        header_font = QFont()
-        header_font.setBold(True)
-        header_font.setPointSize(10)
-        self.header_label.setFont(header_font)
+        self.header_label.setFont(self.header_font())
         self.header_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.header_label)
         
@@ -120,34 +244,28 @@ class WorkerCard(QWidget):
         self.current_metrics = metrics
         
         # Update header
-        self.header_label.setText(f"{metrics.worker_type}-{metrics.worker_id}")
+        _set_if_changed(self.header_label, f"{metrics.worker_type}-{metrics.worker_id}")
         
         # Update status
-        status_icons = {
-            'idle': '🟡 Idle',
-            'processing': '🟢 Processing',
-            'waiting': '🟡 Waiting',
-            'error': '🔴 Error'
-        }
-        self.status_label.setText(status_icons.get(metrics.status, '❓ Unknown'))
+        _set_if_changed(self.status_label, self._STATUS_ICONS.get(metrics.status, '❓ Unknown'))
         
         # Update batch info
-        self.batch_label.setText(f"{metrics.current_batch_size}/{metrics.max_batch_size}")
+        _set_if_changed(self.batch_label, f"{metrics.current_batch_size}/{metrics.max_batch_size}")
         
         # Update speed
-        self.speed_label.setText(f"{metrics.files_per_second:.0f} fps")
+        _set_if_changed(self.speed_label, _fmt_fps(round(metrics.files_per_second)))
         
         # Update resource utilization
         if metrics.worker_type == 'GPU' and metrics.gpu_utilization is not None:
-            self.resource_label.setText(f"GPU: {metrics.gpu_utilization:.0f}%")
+            _set_if_changed(self.resource_label, _fmt_usage('GPU', round(metrics.gpu_utilization)))
         elif metrics.cpu_utilization is not None:
-            self.resource_label.setText(f"CPU: {metrics.cpu_utilization:.0f}%")
+            _set_if_changed(self.resource_label, _fmt_usage('CPU', round(metrics.cpu_utilization)))
         else:
-            self.resource_label.setText("Resource: N/A")
+            _set_if_changed(self.resource_label, "Resource: N/A")
         
         # Update error message
         if metrics.error_message:
-            self.error_label.setText(f"Error: {metrics.error_message}")
+            _set_if_changed(self.error_label, f"Error: {metrics.error_message}")
             self.error_label.setVisible(True)
         else:
             self.error_label.setVisible(False)
@@ -157,41 +275,34 @@ class WorkerCard(QWidget):
     
     def update_style(self, status: str):
         """Update the visual style based on worker status."""
-        style_map = {
-            'idle': {
-                'background': '#FFF3E0',
-                'border': '#FF9800'
-            },
-            'processing': {
-                'background': '#E8F5E8',
-                'border': '#4CAF50'
-            },
-            'waiting': {
-                'background': '#FFF8E1',
-                'border': '#FFC107'
-            },
-            'error': {
-                'background': '#FFEBEE',
-                'border': '#F44336'
-            }
-        }
+        if status not in self._QSS_BY_STATUS:
+            status = 'idle'
+        if status == self._applied_status:
+            return
         
-        style = style_map.get(status, style_map['idle'])
-        
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {style['background']};
-                border: 2px solid {style['border']};
-                border-radius: 8px;
-            }}
-        """)
+        self.setStyleSheet(self._QSS_BY_STATUS[status])
+        self._applied_status = status
 
 
 class SystemStatsWidget(QWidget):
     """Widget showing overall system performance statistics."""
     
+    # Bottleneck label stylesheets, formatted once
+    _BOTTLENECK_QSS = {
+        bottleneck: f"color: {color}; font-weight: bold;"
+        for bottleneck, color in {
+            'None': '#4CAF50',
+            'CPU': '#FF9800',
+            'GPU': '#F44336',
+            'Memory': '#9C27B0',
+            'Storage': '#607D8B'
+        }.items()
+    }
+    _DEFAULT_BOTTLENECK_QSS = "color: #666666; font-weight: bold;"
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._last_bottleneck: Optional[str] = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -235,25 +346,42 @@ class SystemStatsWidget(QWidget):
         self.stats_labels['eta'].setText(metrics.estimated_completion)
         self.stats_labels['bottleneck'].setText(metrics.current_bottleneck)
         
-        # Color code bottleneck
-        bottleneck_colors = {
-            'None': '#4CAF50',
-            'CPU': '#FF9800',
-            'GPU': '#F44336',
-            'Memory': '#9C27B0',
-            'Storage': '#607D8B'
-        }
+        # Color code bottleneck (restyling only when it changes)
+        if metrics.current_bottleneck == self._last_bottleneck:
+            return
+        self._last_bottleneck = metrics.current_bottleneck
         
-        color = bottleneck_colors.get(metrics.current_bottleneck, '#666666')
-        self.stats_labels['bottleneck'].setStyleSheet(f"color: {color}; font-weight: bold;")
+        self.stats_labels['bottleneck'].setStyleSheet(
+            self._BOTTLENECK_QSS.get(metrics.current_bottleneck, self._DEFAULT_BOTTLENECK_QSS)
+        )
 
 
 class LogViewerWidget(QWidget):
     """Advanced log viewer with filtering and search capabilities."""
     
+    LEVEL_COLORS = {
+        'DEBUG': '#666666',
+        'INFO': '#2196F3',
+        'WARNING': '#FF9800',
+        'ERROR': '#F44336'
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.log_entries: List[Dict[str, Any]] = []
+        self.log_entries: Deque[Dict[str, Any]] = deque(maxlen=MAX_LOG_ENTRIES)
+        self._known_workers = {"All"}  # Mirrors the worker filter's items
+        
+        # Current filter values, kept in sync by the filter widgets' signals
+        self._current_worker = "All"
+        self._current_level = "All"
+        self._current_search = ""
+        
+        # Coalesces bursts of filter changes (e.g. typing) into one re-filter
+        self._filter_debounce = QTimer(self)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_debounce.timeout.connect(self.apply_filters)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -267,21 +395,21 @@ class LogViewerWidget(QWidget):
         filter_layout.addWidget(QLabel("Worker:"))
         self.worker_filter = QComboBox()
         self.worker_filter.addItem("All")
-        self.worker_filter.currentTextChanged.connect(self.apply_filters)
+        self.worker_filter.currentTextChanged.connect(self.on_worker_filter_changed)
         filter_layout.addWidget(self.worker_filter)
         
         # Level filter
         filter_layout.addWidget(QLabel("Level:"))
         self.level_filter = QComboBox()
         self.level_filter.addItems(["All", "DEBUG", "INFO", "WARNING", "ERROR"])
-        self.level_filter.currentTextChanged.connect(self.apply_filters)
+        self.level_filter.currentTextChanged.connect(self.on_level_filter_changed)
         filter_layout.addWidget(self.level_filter)
         
         # Search
         filter_layout.addWidget(QLabel("🔍 Search:"))
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search logs...")
-        self.search_input.textChanged.connect(self.apply_filters)
+        self.search_input.textChanged.connect(self.on_search_changed)
         filter_layout.addWidget(self.search_input)
         
         filter_layout.addStretch()
@@ -294,9 +422,19 @@ class LogViewerWidget(QWidget):
         layout.addLayout(filter_layout)
         
         # Log display
-        self.log_display = QTextEdit()
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
         self.log_display.setFont(QFont("Consolas", 9))
+        # Old lines are evicted by the document itself as new ones are appended
+        self.log_display.setMaximumBlockCount(MAX_DISPLAYED_LOG_LINES)
+        
+        # One character format per level; each line is colored by its level
+        self._level_formats = {}
+        for level, color in self.LEVEL_COLORS.items():
+            level_format = QTextCharFormat()
+            level_format.setForeground(QColor(color))
+            self._level_formats[level] = level_format
+        self._default_format = QTextCharFormat()
         layout.addWidget(self.log_display)
         
         # Auto-scroll checkbox
@@ -316,40 +454,78 @@ class LogViewerWidget(QWidget):
             'timestamp': timestamp,
             'worker_id': worker_id,
             'level': level,
-            'message': message
+            'message': message,
+            '_message_lc': message.lower()  # Case-folded once for searching
         }
         
         self.log_entries.append(entry)
         
         # Update worker filter if new worker
-        if worker_id not in [self.worker_filter.itemText(i) for i in range(self.worker_filter.count())]:
+        if worker_id not in self._known_workers:
+            self._known_workers.add(worker_id)
             self.worker_filter.addItem(worker_id)
         
-        # Keep only last 1000 entries
-        if len(self.log_entries) > 1000:
-            self.log_entries = self.log_entries[-1000:]
-        
+        # Hidden (e.g. on another tab): re-render once in showEvent instead
+        if self.isVisible() and self.matches_filters(entry):
+            self.append_formatted(entry)
+    
+    def showEvent(self, event):
+        """Catch up on entries that arrived while hidden."""
+        super().showEvent(event)
         self.apply_filters()
     
+    def on_worker_filter_changed(self, text: str):
+        """Remember the selected worker and schedule a re-filter."""
+        self._current_worker = text
+        self._filter_debounce.start()
+    
+    def on_level_filter_changed(self, text: str):
+        """Remember the selected level and schedule a re-filter."""
+        self._current_level = text
+        self._filter_debounce.start()
+    
+    def on_search_changed(self, text: str):
+        """Remember the (case-folded) search text and schedule a re-filter."""
+        self._current_search = text.lower()
+        self._filter_debounce.start()
+    
+    def matches_filters(self, entry: Dict[str, Any]) -> bool:
+        """Check an entry against the current worker, level and search filters."""
+        worker_filter = self._current_worker
+        level_filter = self._current_level
+        search_text = self._current_search
+        
+        # Level filter
+        if level_filter != "All" and entry['level'] != level_filter:
+            return False
+        
+        # Worker filter
+        if worker_filter != "All" and entry['worker_id'] != worker_filter:
+            return False
+        
+        # Search filter
+        if search_text and search_text not in entry['_message_lc']:
+            return False
+        
+        return True
+    
     def apply_filters(self):
         """Apply current filters to log display."""
-        worker_filter = self.worker_filter.currentText()
-        level_filter = self.level_filter.currentText()
-        search_text = self.search_input.text().lower()
+        worker_filter = self._current_worker
+        level_filter = self._current_level
+        search_text = self._current_search
         
         filtered_entries = []
         
         for entry in self.log_entries:
-            # Worker filter
-            if worker_filter != "All" and entry['worker_id'] != worker_filter:
+            # Cheapest checks first: level, then worker, then substring search
+            if level_filter != "All" and entry['level'] != level_filter:
                 continue
             
-            # Level filter
-            if level_filter != "All" and entry['level'] != level_filter:
+            if worker_filter != "All" and entry['worker_id'] != worker_filter:
                 continue
             
-            # Search filter
-            if search_text and search_text not in entry['message'].lower():
+            if search_text and search_text not in entry['_message_lc']:
                 continue
             
             filtered_entries.append(entry)
@@ -357,28 +533,29 @@ class LogViewerWidget(QWidget):
         # Update display
         self.update_display(filtered_entries)
     
+    def format_entry(self, entry: Dict[str, Any]) -> str:
+        """Format a log entry as a plain text line."""
+        return f"{entry['timestamp']} {entry['worker_id']} {entry['level']} {entry['message']}"
+    
+    def append_formatted(self, entry: Dict[str, Any]):
+        """Append a single entry without rebuilding the display."""
+        self.append_line(entry)
+        
+        # Auto-scroll to bottom
+        scrollbar = self.log_display.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+    
+    def append_line(self, entry: Dict[str, Any]):
+        """Append an entry's line in its level color."""
+        self.log_display.setCurrentCharFormat(self._level_formats.get(entry['level'], self._default_format))
+        self.log_display.appendPlainText(self.format_entry(entry))
+    
     def update_display(self, entries: List[Dict[str, Any]]):
-        """Update the log display with filtered entries."""
+        """Rebuild the log display from filtered entries (after a filter change)."""
         self.log_display.clear()
         
-        for entry in entries[-100:]:  # Show last 100 entries
-            level_colors = {
-                'DEBUG': '#666666',
-                'INFO': '#2196F3',
-                'WARNING': '#FF9800',
-                'ERROR': '#F44336'
-            }
-            
-            color = level_colors.get(entry['level'], '#000000')
-            
-            formatted_entry = (
-                f"<span style='color: #888888'>{entry['timestamp']}</span> "
-                f"<span style='color: #4CAF50'>{entry['worker_id']}</span> "
-                f"<span style='color: {color}; font-weight: bold'>{entry['level']}</span> "
-                f"<span>{entry['message']}</span>"
-            )
-            
-            self.log_display.append(formatted_entry)
+        for entry in entries[-MAX_DISPLAYED_LOG_LINES:]:  # Show last 100 entries
+            self.append_line(entry)
         
         # Auto-scroll to bottom
         scrollbar = self.log_display.verticalScrollBar()
@@ -391,8 +568,32 @@ class LogViewerWidget(QWidget):
     
     def export_logs(self):
         """Export logs to file."""
-        # TODO: Implement log export functionality
-        pass
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Logs",
+            f"engine_room_logs_{time.strftime('%Y%m%d_%H%M%S')}.log",
+            "Log Files (*.log);;Text Files (*.txt);;All Files (*)"
+        )
+        
+        if not file_path:
+            return
+        
+        # Written straight from the structured entries, never from the display document
+        try:
+            with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.writelines(
+                    f"{entry['timestamp']}\t{entry['worker_id']}\t{entry['level']}\t{entry['message']}\n"
+                    for entry in self.log_entries
+                )
+        except OSError as e:
+            QMessageBox.critical(self, "Export Error", f"Failed to export logs:\n{e}")
+            return
+        
+        QMessageBox.information(
+            self,
+            "Export Successful",
+            f"Exported {len(self.log_entries)} log entries to:\n{file_path}"
+        )
 
 
 class EngineRoomDialog(QDialog):
@@ -404,11 +605,18 @@ class EngineRoomDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.worker_cards: Dict[str, WorkerCard] = {}
+        self.metrics_board = WorkerMetricsBoard()
+        self._card_versions: Dict[str, int] = {}  # Board version each card last showed
         self.update_timer = QTimer()
         self.mock_data_enabled = True  # For demonstration
         
+        # Log entries produced before the Logs tab is first opened
+        self._pending_log_entries: Deque[tuple] = deque(maxlen=MAX_LOG_ENTRIES)
+        self.log_viewer: Optional[LogViewerWidget] = None
+        
         self.setup_ui()
         self.setup_mock_data()
+        self.ensure_tab_built(self.tab_widget.currentIndex())
         self.start_updates()
     
     def setup_ui(self):
@@ -429,22 +637,21 @@ class EngineRoomDialog(QDialog):
         header_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(header_label)
         
-        # Create tabbed interface
-        tab_widget = QTabWidget()
+        # Create tabbed interface; each tab's contents are built on first activation
+        self.tab_widget = QTabWidget()
+        self._tab_builders = {}
         
         # Workers tab
-        workers_tab = self.create_workers_tab()
-        tab_widget.addTab(workers_tab, "👥 Workers")
+        self.workers_tab = self.add_lazy_tab(self.create_workers_tab, "👥 Workers")
         
         # System stats tab
-        stats_tab = self.create_stats_tab()
-        tab_widget.addTab(stats_tab, "📊 System Stats")
+        self.add_lazy_tab(self.create_stats_tab, "📊 System Stats")
         
         # Logs tab
-        logs_tab = self.create_logs_tab()
-        tab_widget.addTab(logs_tab, "📋 Logs")
+        self.add_lazy_tab(self.create_logs_tab, "📋 Logs")
         
-        main_layout.addWidget(tab_widget)
+        self.tab_widget.currentChanged.connect(self.ensure_tab_built)
+        main_layout.addWidget(self.tab_widget)
         
         # Control buttons
         button_layout = QHBoxLayout()
@@ -463,6 +670,21 @@ class EngineRoomDialog(QDialog):
         
         main_layout.addLayout(button_layout)
     
+    def add_lazy_tab(self, builder, title: str) -> QWidget:
+        """Add an empty tab page whose contents builder() creates when first shown."""
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        index = self.tab_widget.addTab(page, title)
+        self._tab_builders[index] = builder
+        return page
+    
+    def ensure_tab_built(self, index: int):
+        """Build a tab's contents the first time it is activated."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            self.tab_widget.widget(index).layout().addWidget(builder())
+    
     def create_workers_tab(self) -> QWidget:
         """Create the workers visualization tab."""
         tab = QWidget()
@@ -494,6 +716,8 @@ class EngineRoomDialog(QDialog):
         workers_layout.addWidget(scroll_area)
         layout.addWidget(workers_group)
         
+        self.create_worker_cards()
+        
         return tab
     
     def create_stats_tab(self) -> QWidget:
@@ -518,11 +742,15 @@ class EngineRoomDialog(QDialog):
         self.log_viewer = LogViewerWidget()
         layout.addWidget(self.log_viewer)
         
+        # Replay what was logged before the tab was first opened
+        while self._pending_log_entries:
+            self.log_viewer.add_log_entry(*self._pending_log_entries.popleft())
+        
         return tab
     
     def setup_mock_data(self):
         """Setup mock data for demonstration."""
-        # Create mock worker cards
+        # Mock workers; their cards are created with the Workers tab
         worker_configs = [
             ('GPU-Worker-1', 'GPU'),
             ('GPU-Worker-2', 'GPU'),
@@ -532,7 +760,24 @@ class EngineRoomDialog(QDialog):
             ('CPU-Worker-4', 'CPU')
         ]
         
-        for i, (worker_id, worker_type) in enumerate(worker_configs):
+        # One reusable metrics object per worker, updated in place each tick
+        self._metrics_by_worker: Dict[str, WorkerMetrics] = {}
+        for worker_id, worker_type in worker_configs:
+            self.metrics_board.register(worker_id)
+            self._metrics_by_worker[worker_id] = WorkerMetrics(
+                worker_id.split('-')[-1],
+                worker_type,
+                'idle',
+                0,
+                64 if worker_type == 'GPU' else 32,
+                0.0
+            )
+        
+        self._worker_ids = tuple(worker_id for worker_id, worker_type in worker_configs)
+    
+    def create_worker_cards(self):
+        """Create a card per known worker in the workers grid."""
+        for i, worker_id in enumerate(self._worker_ids):
             card = WorkerCard(worker_id)
             self.worker_cards[worker_id] = card
             
@@ -541,30 +786,70 @@ class EngineRoomDialog(QDialog):
             col = i % 3
             self.workers_grid.addWidget(card, row, col)
     
+    def add_log_entry(self, timestamp: str, worker_id: str, level: str, message: str):
+        """Add a log entry, holding it until the Logs tab has been built."""
+        if self.log_viewer is None:
+            self._pending_log_entries.append((timestamp, worker_id, level, message))
+        else:
+            self.log_viewer.add_log_entry(timestamp, worker_id, level, message)
+    
     def start_updates(self):
         """Start the real-time update timer."""
         self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(1000)  # Update every second
+        self.update_timer.setInterval(1000)  # Update every second
+        # A 1 Hz dashboard doesn't need ms precision; let the OS batch wakeups
+        self.update_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.update_timer.start()
     
     def update_display(self):
         """Update the entire display with current data."""
+        # Nothing to draw while the dialog is hidden or minimized
+        if not self.isVisible() or self.isMinimized():
+            return
+        
+        # Worker cards and stats are only redrawn while the Workers tab is showing
+        if self.tab_widget.currentWidget() is self.workers_tab:
+            # Hold repaints so all cards and stats are painted in a single pass
+            self.workers_tab.setUpdatesEnabled(False)
+            try:
+                if self.mock_data_enabled:
+                    self.update_mock_workers()
+                self.update_worker_cards()
+            finally:
+                self.workers_tab.setUpdatesEnabled(True)
+        
         if self.mock_data_enabled:
             self.update_mock_data()
     
+    def update_worker_cards(self):
+        """Apply the latest published worker metrics to their cards."""
+        for worker_id, version, metrics in self.metrics_board.snapshot():
+            card = self.worker_cards.get(worker_id)
+            if card is not None and self._card_versions.get(worker_id) != version:
+                card.update_metrics(metrics)
+                self._card_versions[worker_id] = version
+    
     def update_mock_data(self):
-        """Update with mock data for demonstration."""
-        import random
-        import time
-        
-        # Mock worker metrics
-        statuses = ['idle', 'processing', 'waiting']
+        """Add mock log entries for demonstration."""
+        # Add mock log entries occasionally
+        if random.random() < 0.3:  # 30% chance each update
+            worker_id = random.choice(self._worker_ids)
+            level = random.choice(MOCK_LOG_LEVELS)
+            message = random.choice(MOCK_LOG_MESSAGES)
+            
+            timestamp = time.strftime("%H:%M:%S")
+            self.add_log_entry(timestamp, worker_id, level, message)
+    
+    def update_mock_workers(self):
+        """Publish mock worker metrics and update the system stats."""
+        # Mock worker metrics, one status per worker drawn in a single call
+        statuses = random.choices(MOCK_STATUSES, k=len(self._worker_ids))
         
         total_throughput = 0
         active_workers = 0
         
-        for worker_id, card in self.worker_cards.items():
+        for worker_id, status in zip(self._worker_ids, statuses):
             worker_type = 'GPU' if 'GPU' in worker_id else 'CPU'
-            status = random.choice(statuses)
             
             if status == 'processing':
                 active_workers += 1
@@ -584,51 +869,33 @@ class EngineRoomDialog(QDialog):
             
             total_throughput += fps
             
-            metrics = WorkerMetrics(
-                worker_id=worker_id.split('-')[-1],
-                worker_type=worker_type,
-                status=status,
-                current_batch_size=batch_size,
-                max_batch_size=max_batch,
-                files_per_second=fps,
-                gpu_utilization=gpu_util,
-                cpu_utilization=cpu_util if worker_type == 'CPU' else None,
-                memory_usage_mb=random.uniform(500, 1500),
-                last_updated=time.time()
-            )
+            # Update this worker's metrics object in place and republish it
+            metrics = self._metrics_by_worker[worker_id]
+            metrics.status = status
+            metrics.current_batch_size = batch_size
+            metrics.max_batch_size = max_batch
+            metrics.files_per_second = fps
+            metrics.gpu_utilization = gpu_util
+            metrics.cpu_utilization = cpu_util if worker_type == 'CPU' else None
+            metrics.memory_usage_mb = random.uniform(500, 1500)
+            metrics.last_updated = time.time()
             
-            card.update_metrics(metrics)
+            self.metrics_board.publish(worker_id, metrics)
         
         # Update system stats
         system_metrics = SystemMetrics(
-            total_throughput=total_throughput,
-            active_workers=active_workers,
-            total_workers=len(self.worker_cards),
-            queue_size=random.randint(50, 500),
-            errors_count=random.randint(0, 3),
-            files_processed=random.randint(1000, 5000),
-            total_files=10000,
-            estimated_completion=f"{random.randint(2, 8)} minutes",
-            current_bottleneck=random.choice(['None', 'CPU', 'GPU Memory', 'Storage'])
+            total_throughput,
+            active_workers,
+            len(self._worker_ids),
+            random.randint(50, 500),  # queue_size
+            random.randint(0, 3),  # errors_count
+            random.randint(1000, 5000),  # files_processed
+            10000,  # total_files
+            f"{random.randint(2, 8)} minutes",  # estimated_completion
+            random.choice(MOCK_BOTTLENECKS)  # current_bottleneck
         )
         
         self.system_stats.update_stats(system_metrics)
-        
-        # Add mock log entries occasionally
-        if random.random() < 0.3:  # 30% chance each update
-            worker_id = random.choice(list(self.worker_cards.keys()))
-            level = random.choice(['INFO', 'DEBUG', 'WARNING'])
-            messages = [
-                "Processed batch of 32 files",
-                "GPU memory usage at 78%",
-                "Batch processing completed",
-                "Worker ready for next batch",
-                "Performance optimization applied"
-            ]
-            message = random.choice(messages)
-            
-            timestamp = time.strftime("%H:%M:%S")
-            self.log_viewer.add_log_entry(timestamp, worker_id, level, message)
     
     def toggle_mock_data(self):
         """Toggle mock data generation."""
@@ -639,6 +906,16 @@ class EngineRoomDialog(QDialog):
         else:
             self.mock_toggle.setText("🎭 Enable Mock Data")
     
+    def showEvent(self, event):
+        """Resume updates when the dialog is shown."""
+        super().showEvent(event)
+        self.update_timer.start()
+    
+    def hideEvent(self, event):
+        """Stop the update timer entirely while hidden."""
+        self.update_timer.stop()
+        super().hideEvent(event)
+    
     def closeEvent(self, event):
         """Handle dialog close event."""
         self.update_timer.stop()
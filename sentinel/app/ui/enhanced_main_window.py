@@ -4,28 +4,182 @@ Sentinel 2.0 - Enhanced Main Window
 ONE window with ALL functionality - no more popup dialogs!
 """
 
+import functools
+import threading
+from itertools import islice
 import time
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
+from collections import deque
+from PyQt6.QtCore import (
+    Qt, QThread, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool,
+    QSignalBlocker
+)
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
-    QProgressBar, QFileDialog, QTextEdit, QTabWidget, QTableWidget, 
-    QTableWidgetItem, QComboBox, QSpinBox, QCheckBox, QGroupBox, QFormLayout,
-    QSplitter, QFrame, QScrollArea, QGridLayout, QMessageBox
+    QProgressBar, QFileDialog, QTextEdit, QPlainTextEdit, QTabWidget, QTableView, 
+    QComboBox, QSpinBox, QCheckBox, QGroupBox, QFormLayout,
+    QSplitter, QFrame, QScrollArea, QGridLayout, QMessageBox, QHeaderView
 )
-from PyQt6.QtGui import QFont, QColor, QPalette
+from PyQt6.QtGui import QFont, QColor, QPalette, QTextCursor
 
 from sentinel.app.config_manager import ConfigManager
 
+# Coalesce worker progress into one emission per batch of files or interval
+STATS_EMIT_BATCH = 32
+STATS_EMIT_INTERVAL_NS = 100_000_000
+# ETA values stats_changed uses for the states that have no time estimate
+ETA_CALCULATING = -1.0
+ETA_COMPLETE = -2.0
+
+# Live log lines are buffered and flushed to the widget at most this often
+LOG_FLUSH_INTERVAL_MS = 100
+MAX_LOG_LINES = 10000
+
+# Confidence cells are one of 101 values, so their strings are built once
+CONF_STRS = [f"{i/100:.2f}" for i in range(101)]
+STATUS_SUCCESS = "✅ Success"
+STATUS_FAILED = "❌ Failed"
+# Column auto-sizing only measures this many rows of the results table
+RESIZE_SAMPLE_ROWS = 200
+# Uniform row height lets the results view compute scroll geometry without measuring rows
+RESULT_ROW_HEIGHT = 22
+
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_eta(tenths: int) -> str:
+    eta_seconds = tenths / 10
+    if eta_seconds < 60:
+        return f"ETA: {eta_seconds:.0f}s"
+    if eta_seconds < 3600:
+        return f"ETA: {eta_seconds/60:.1f}m"
+    return f"ETA: {eta_seconds/3600:.1f}h"
+
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_rate(tenths: int) -> str:
+    return f"{tenths / 10:.1f} files/sec"
+
+
+def _set_if_changed(label: QLabel, text: str):
+    """Set a label's text only if it differs, avoiding a needless relayout/repaint."""
+    if label.text() != text:
+        label.setText(text)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_run_analysis():
+    """Import the analysis pipeline on first use; later runs reuse it."""
+    from sentinel.app.pipeline import run_analysis
+    return run_analysis
+
+
+@functools.lru_cache(maxsize=1)
+def detect_system_info() -> str:
+    """Describe the OS, CPU, RAM and GPU; cached since the hardware doesn't change."""
+    import platform
+    import subprocess
+    import psutil
+    
+    cpu_count = psutil.cpu_count()
+    memory = psutil.virtual_memory()
+    memory_gb = memory.total / (1024**3)
+    
+    info = f"OS: {platform.system()}\n"
+    info += f"CPU: {cpu_count} cores\n"
+    info += f"RAM: {memory_gb:.1f} GB\n"
+    
+    # Try to detect GPU
+    try:
+        result = subprocess.run(['nvidia-smi', '--query-gpu=name', '--format=csv,noheader'], 
+                              capture_output=True, text=True, timeout=3)
+        if result.returncode == 0:
+            gpu_name = result.stdout.strip()
+            info += f"GPU: {gpu_name}\n"
+        else:
+            info += "GPU: Not detected\n"
+    except Exception:
+        info += "GPU: Not detected\n"
+    
+    return info
+
+
+class SystemInfoSignals(QObject):
+    """Signals used by SystemInfoTask to hand the result back to the GUI thread."""
+    finished = pyqtSignal(str)  # system info text, empty on failure
+
+
+class SystemInfoTask(QRunnable):
+    """Run detect_system_info on a thread pool so nvidia-smi never blocks the UI."""
+    
+    def __init__(self, signals):
+        super().__init__()
+        self.signals = signals
+    
+    def run(self):
+        try:
+            info = detect_system_info()
+        except Exception:
+            info = ""
+        
+        try:
+            self.signals.finished.emit(info)
+        except RuntimeError:
+            pass  # Window was destroyed while detection was running
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """Read-only table model over per-column lists of display strings."""
+    
+    HEADERS = ["Original Path", "Suggested Path", "Category", "Tags", "Confidence", "Status"]
+    MAX_TAGS = 3
+    NO_TAGS = 'None'
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = self.build_columns([])
+    
+    @classmethod
+    def build_columns(cls, results):
+        """Split result dicts into one list of cell strings per column."""
+        max_tags = cls.MAX_TAGS
+        no_tags = cls.NO_TAGS
+        return [
+            [r.get('original_path', '') for r in results],
+            [r.get('suggested_path', '') for r in results],
+            [r.get('category', 'N/A') for r in results],
+            [', '.join(islice(tags, max_tags)) if (tags := r.get('tags')) else no_tags for r in results],
+            [CONF_STRS[max(0, min(100, round(r.get('confidence', 0) * 100)))] for r in results],
+            [STATUS_SUCCESS if r.get('success', True) else STATUS_FAILED for r in results],
+        ]
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns[0])
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self._columns[index.column()][index.row()]
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def set_columns(self, columns):
+        """Show prebuilt *columns* from build_columns."""
+        self.beginResetModel()
+        self._columns = columns
+        self.endResetModel()
+
 
 class EnhancedAnalysisWorker(QThread):
     """Enhanced worker with detailed progress reporting."""
     
-    progress_changed = pyqtSignal(int)
     status_changed = pyqtSignal(str)
-    eta_changed = pyqtSignal(str)
-    throughput_changed = pyqtSignal(str)
-    files_processed = pyqtSignal(int, int)  # processed, total
-    results_ready = pyqtSignal(list)
+    stats_changed = pyqtSignal(int, int, int, float, float)  # processed, total, progress, eta seconds, rate
+    results_ready = pyqtSignal(list, dict, list)  # results, summary, table columns
     finished_success = pyqtSignal()
     
     def __init__(self, directory, config_mgr, db_manager, logger_manager=None, performance_monitor=None):
@@ -38,15 +192,44 @@ class EnhancedAnalysisWorker(QThread):
         self.start_time = None
         self.files_processed_count = 0
         self.total_files = 0
+        self._last_emit_n = 0
+        self._start_ns = 0
+        self._last_emit_ns = 0
+        self.cat_counts = {}
+        self.conf_sum = 0.0
+        self.success_n = 0
+        self._cancel = threading.Event()
         
         if self.logger_manager:
             self.logger = self.logger_manager.get_logger('enhanced_analysis_worker')
     
+    def cancel(self):
+        """Ask the analysis to stop at its next checkpoint."""
+        self._cancel.set()
+    
+    def record_result(self, result):
+        """Fold one result into the running category, confidence and success totals."""
+        category = result.get('category', 'Unknown')
+        self.cat_counts[category] = self.cat_counts.get(category, 0) + 1
+        self.conf_sum += result.get('confidence', 0)
+        if result.get('success', True):
+            self.success_n += 1
+    
+    def summary(self):
+        """Aggregated result statistics for the performance report."""
+        return {
+            'successful': self.success_n,
+            'confidence_sum': self.conf_sum,
+            'categories': dict(self.cat_counts),
+            'cancelled': self._cancel.is_set(),
+        }
+    
     def run(self):
         """Run analysis with detailed progress reporting."""
-        from sentinel.app.pipeline import run_analysis
+        run_analysis = _get_run_analysis()
         
         self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         
         try:
             # Start analysis
@@ -57,33 +240,27 @@ class EnhancedAnalysisWorker(QThread):
                 self.files_processed_count = processed
                 self.total_files = total
                 
+                # Only emit once per batch of files or interval, and always on the last file
+                now_ns = time.monotonic_ns()
+                if (processed - self._last_emit_n < STATS_EMIT_BATCH
+                        and now_ns - self._last_emit_ns < STATS_EMIT_INTERVAL_NS
+                        and processed != total):
+                    return
+                self._last_emit_n = processed
+                self._last_emit_ns = now_ns
+                
                 # Calculate progress percentage
                 progress = int((processed / total) * 100) if total > 0 else 0
-                self.progress_changed.emit(progress)
                 
-                # Calculate ETA
-                elapsed = time.time() - self.start_time
-                if processed > 0:
-                    rate = processed / elapsed
-                    remaining = total - processed
-                    eta_seconds = remaining / rate if rate > 0 else 0
-                    
-                    # Format ETA
-                    if eta_seconds < 60:
-                        eta_str = f"{eta_seconds:.0f}s"
-                    elif eta_seconds < 3600:
-                        eta_str = f"{eta_seconds/60:.1f}m"
-                    else:
-                        eta_str = f"{eta_seconds/3600:.1f}h"
-                    
-                    self.eta_changed.emit(f"ETA: {eta_str}")
-                    self.throughput_changed.emit(f"{rate:.1f} files/sec")
+                # Calculate ETA (total is 0 while the pipeline doesn't know it yet)
+                elapsed = (now_ns - self._start_ns) * 1e-9
+                rate = processed / elapsed if elapsed > 0 else 0.0
+                if total > 0 and rate > 0:
+                    eta_seconds = (total - processed) / rate
                 else:
-                    self.eta_changed.emit("ETA: Calculating...")
-                    self.throughput_changed.emit("0.0 files/sec")
+                    eta_seconds = ETA_CALCULATING
                 
-                # Update file count
-                self.files_processed.emit(processed, total)
+                self.stats_changed.emit(processed, total, progress, eta_seconds, rate)
                 
                 # Update status with current file
                 if current_file:
@@ -95,22 +272,30 @@ class EnhancedAnalysisWorker(QThread):
                 db=self.db,
                 config=self.config_mgr.config,
                 logger_manager=self.logger_manager,
-                performance_monitor=self.performance_monitor
+                performance_monitor=self.performance_monitor,
+                cancel_cb=self._cancel.is_set,
+                progress_cb=progress_callback
             )
             
-            # Final updates
-            self.progress_changed.emit(100)
-            self.status_changed.emit("✅ Analysis Complete!")
+            for result in results:
+                self.record_result(result)
             
-            elapsed = time.time() - self.start_time
+            # Final updates; a cancelled run still reports the results it has
+            elapsed = (time.monotonic_ns() - self._start_ns) * 1e-9
             final_rate = len(results) / elapsed if elapsed > 0 else 0
-            self.throughput_changed.emit(f"Final: {final_rate:.1f} files/sec")
-            self.eta_changed.emit("Complete!")
+            self.stats_changed.emit(len(results), len(results), 100, ETA_COMPLETE, final_rate)
+            if self._cancel.is_set():
+                self.status_changed.emit("⏹️ Analysis Stopped")
+            else:
+                self.status_changed.emit("✅ Analysis Complete!")
             
-            self.results_ready.emit(results)
+            # Format the table cells here rather than on the GUI thread
+            columns = ResultsTableModel.build_columns(results)
+            self.results_ready.emit(results, self.summary(), columns)
             
             if self.logger_manager:
-                self.logger.info(f"Analysis completed: {len(results)} files in {elapsed:.2f}s")
+                outcome = "stopped" if self._cancel.is_set() else "completed"
+                self.logger.info(f"Analysis {outcome}: {len(results)} files in {elapsed:.2f}s")
                 
         except Exception as e:
             self.status_changed.emit(f"❌ Error: {str(e)}")
@@ -142,11 +327,14 @@ class EnhancedMainWindow(QMainWindow):
         # State
         self.directory_path = None
         self.worker = None
+        self._close_pending = False
         self.analysis_results = []
+        self.analysis_stopped = False
+        self._log_buf = deque(maxlen=MAX_LOG_LINES)
         
         # Setup UI
         self.setup_ui()
-        self.setup_timer()
+        self.setup_log_flush_timer()
         
         if self.logger_manager:
             self.logger.info("Enhanced main window initialized")
@@ -280,13 +468,17 @@ class EnhancedMainWindow(QMainWindow):
         system_group = QGroupBox("💻 System Info")
         system_layout = QVBoxLayout(system_group)
         
-        self.system_info_label = QLabel(self.get_system_info())
+        self.system_info_label = QLabel("Detecting...")
         self.system_info_label.setWordWrap(True)
         self.system_info_label.setStyleSheet("QLabel { font-family: monospace; font-size: 10px; }")
         system_layout.addWidget(self.system_info_label)
         
         left_layout.addWidget(system_group)
         
+        self._system_info_signals = SystemInfoSignals(self)
+        self._system_info_signals.finished.connect(self.on_system_info_ready)
+        QThreadPool.globalInstance().start(SystemInfoTask(self._system_info_signals))
+        
         left_layout.addStretch()
         
         return left_widget
@@ -317,17 +509,20 @@ class EnhancedMainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         
         # Log tab
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(MAX_LOG_LINES)
         self.log_text.setFont(QFont("Consolas", 9))
         self.tab_widget.addTab(self.log_text, "📝 Live Log")
         
         # Results tab
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(6)
-        self.results_table.setHorizontalHeaderLabels([
-            "Original Path", "Suggested Path", "Category", "Tags", "Confidence", "Status"
-        ])
+        self.results_model = ResultsTableModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        self.results_table.horizontalHeader().setResizeContentsPrecision(RESIZE_SAMPLE_ROWS)
+        vertical_header = self.results_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(RESULT_ROW_HEIGHT)
         self.tab_widget.addTab(self.results_table, "📋 Results")
         
         # Performance tab
@@ -340,44 +535,20 @@ class EnhancedMainWindow(QMainWindow):
         
         return right_widget
     
-    def setup_timer(self):
-        """Setup timer for real-time updates."""
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(1000)  # Update every second
+    def setup_log_flush_timer(self):
+        """Setup the single-shot timer that flushes buffered log lines."""
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self.log_flush_timer.timeout.connect(self.flush_log)
     
-    def get_system_info(self):
-        """Get system information."""
-        import psutil
-        import platform
-        
-        try:
-            cpu_count = psutil.cpu_count()
-            memory = psutil.virtual_memory()
-            memory_gb = memory.total / (1024**3)
-            
-            info = f"OS: {platform.system()}\n"
-            info += f"CPU: {cpu_count} cores\n"
-            info += f"RAM: {memory_gb:.1f} GB\n"
-            
-            # Try to detect GPU
-            try:
-                import subprocess
-                result = subprocess.run(['nvidia-smi', '--query-gpu=name', '--format=csv,noheader'], 
-                                      capture_output=True, text=True, timeout=3)
-                if result.returncode == 0:
-                    gpu_name = result.stdout.strip()
-                    info += f"GPU: {gpu_name}\n"
-                else:
-                    info += "GPU: Not detected\n"
-            except:
-                info += "GPU: Not detected\n"
-            
-            info += f"Backend: {self.config_mgr.config.ai_backend_mode.title()}"
-            
-            return info
-        except:
-            return "System info unavailable"
+    def format_system_info(self, info):
+        """Append the current backend to the detected hardware *info*."""
+        return info + f"Backend: {self.config_mgr.config.ai_backend_mode.title()}"
+    
+    def on_system_info_ready(self, info):
+        """Show the system info detected on the thread pool."""
+        self.system_info_label.setText(self.format_system_info(info) if info else "System info unavailable")
     
     def select_directory(self):
         """Select directory for analysis."""
@@ -403,8 +574,9 @@ class EnhancedMainWindow(QMainWindow):
         self.status_label.setText("🚀 Initializing Agentic Analysis...")
         
         # Clear previous results
-        self.results_table.setRowCount(0)
+        self.results_model.set_columns(ResultsTableModel.build_columns([]))
         self.analysis_results.clear()
+        self.analysis_stopped = False
         
         # Update configuration
         self.config_mgr.config.ai_backend_mode = self.backend_combo.currentText().lower()
@@ -428,11 +600,8 @@ class EnhancedMainWindow(QMainWindow):
         )
         
         # Connect signals
-        self.worker.progress_changed.connect(self.progress_bar.setValue)
-        self.worker.status_changed.connect(self.status_label.setText)
-        self.worker.eta_changed.connect(self.eta_label.setText)
-        self.worker.throughput_changed.connect(self.throughput_label.setText)
-        self.worker.files_processed.connect(self.update_files_count)
+        self.worker.status_changed.connect(self.on_status)
+        self.worker.stats_changed.connect(self.on_stats)
         self.worker.results_ready.connect(self.on_results_ready)
         self.worker.finished_success.connect(self.on_analysis_finished)
         
@@ -444,132 +613,137 @@ class EnhancedMainWindow(QMainWindow):
     
     def stop_analysis(self):
         """Stop the current analysis."""
-        if self.worker and self.worker.isRunning():
-            self.worker.terminate()
-            self.worker.wait()
-            
-        self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
-        self.status_label.setText("⏹️ Analysis Stopped")
+        if self.worker and self.worker.isRunning():
+            # Cooperative stop; Start is re-enabled by on_analysis_finished
+            self.worker.cancel()
+            self.status_label.setText("⏹️ Stopping analysis...")
+        else:
+            self.start_btn.setEnabled(True)
+            self.status_label.setText("⏹️ Analysis Stopped")
         self.log_message("⏹️ Analysis stopped by user")
         
         if self.logger_manager:
             self.logger.info("Analysis stopped by user")
     
+    def on_stats(self, processed, total, progress, eta_seconds, rate):
+        """Update progress, ETA, throughput and file count from one stats update."""
+        if eta_seconds == ETA_COMPLETE:
+            eta_str = "Complete!"
+        elif eta_seconds == ETA_CALCULATING:
+            eta_str = "ETA: Calculating..."
+        else:
+            eta_str = _fmt_eta(int(eta_seconds * 10))
+        
+        # Nothing listens to valueChanged; don't pay for emitting it
+        with QSignalBlocker(self.progress_bar):
+            self.progress_bar.setValue(progress)
+        _set_if_changed(self.eta_label, eta_str)
+        _set_if_changed(self.throughput_label, _fmt_rate(int(rate * 10)))
+        self.update_files_count(processed, total)
+    
+    def on_status(self, status):
+        """Show the worker's latest status message."""
+        _set_if_changed(self.status_label, status)
+    
     def update_files_count(self, processed, total):
         """Update files count display."""
-        self.files_count_label.setText(f"Files: {processed}/{total}")
+        text = f"Files: {processed}/{total}" if total else f"Files: {processed}"
+        _set_if_changed(self.files_count_label, text)
     
-    def on_results_ready(self, results):
+    def on_results_ready(self, results, summary, columns):
         """Handle analysis results."""
         self.analysis_results = results
-        self.populate_results_table(results)
-        self.update_performance_stats()
+        self.analysis_stopped = summary.get('cancelled', False)
+        self.populate_results_table(results, columns)
+        self.update_performance_stats(summary)
         
-        self.log_message(f"✅ Analysis complete! Processed {len(results)} files")
+        if self.analysis_stopped:
+            self.log_message(f"⏹️ Analysis stopped after {len(results)} files")
+        else:
+            self.log_message(f"✅ Analysis complete! Processed {len(results)} files")
         
         if self.logger_manager:
-            self.logger.info(f"Analysis completed with {len(results)} results")
+            outcome = "stopped" if self.analysis_stopped else "completed"
+            self.logger.info(f"Analysis {outcome} with {len(results)} results")
     
     def on_analysis_finished(self):
         """Handle analysis completion."""
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         
-        if self.analysis_results:
+        if self.analysis_results and not self.analysis_stopped:
             self.tab_widget.setCurrentIndex(1)  # Switch to results tab
     
-    def populate_results_table(self, results):
-        """Populate the results table."""
-        self.results_table.setRowCount(len(results))
+    def populate_results_table(self, results, columns=None):
+        """Populate the results table, building its columns if not given."""
+        if columns is None:
+            columns = ResultsTableModel.build_columns(results)
+        self.results_model.set_columns(columns)
         
-        for row, result in enumerate(results):
-            # Original path
-            self.results_table.setItem(row, 0, QTableWidgetItem(result.get('original_path', '')))
-            
-            # Suggested path
-            self.results_table.setItem(row, 1, QTableWidgetItem(result.get('suggested_path', '')))
-            
-            # Category
-            self.results_table.setItem(row, 2, QTableWidgetItem(result.get('category', 'N/A')))
-            
-            # Tags
-            tags = result.get('tags', [])
-            tags_str = ', '.join(tags[:3]) if tags else 'None'
-            self.results_table.setItem(row, 3, QTableWidgetItem(tags_str))
-            
-            # Confidence
-            confidence = result.get('confidence', 0)
-            self.results_table.setItem(row, 4, QTableWidgetItem(f"{confidence:.2f}"))
-            
-            # Status
-            status = "✅ Success" if result.get('success', True) else "❌ Failed"
-            self.results_table.setItem(row, 5, QTableWidgetItem(status))
-        
-        # Auto-resize columns
+        # Size columns once, then leave them user-resizable
         self.results_table.resizeColumnsToContents()
+        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
     
-    def update_performance_stats(self):
-        """Update performance statistics."""
+    def update_performance_stats(self, summary):
+        """Update performance statistics from the worker's aggregated *summary*."""
         if not self.analysis_results:
             return
         
         total_files = len(self.analysis_results)
-        successful = len([r for r in self.analysis_results if r.get('success', True)])
-        
-        # Calculate category distribution
-        categories = {}
-        for result in self.analysis_results:
-            category = result.get('category', 'Unknown')
-            categories[category] = categories.get(category, 0) + 1
-        
-        # Calculate average confidence
-        confidences = [r.get('confidence', 0) for r in self.analysis_results]
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+        successful = summary['successful']
+        categories = summary['categories']
+        avg_confidence = summary['confidence_sum'] / total_files
         
         # Build performance report
-        stats = f"📊 PERFORMANCE STATISTICS\n"
-        stats += f"{'='*50}\n\n"
-        stats += f"Total Files Processed: {total_files}\n"
-        stats += f"Successful: {successful} ({(successful/total_files)*100:.1f}%)\n"
-        stats += f"Average Confidence: {avg_confidence:.2f}\n\n"
-        
-        stats += f"📋 CATEGORY DISTRIBUTION\n"
-        stats += f"{'-'*30}\n"
+        parts = []
+        append = parts.append
+        append("📊 PERFORMANCE STATISTICS\n")
+        append(f"{'='*50}\n\n")
+        append(f"Total Files Processed: {total_files}\n")
+        append(f"Successful: {successful} ({(successful/total_files)*100:.1f}%)\n")
+        append(f"Average Confidence: {avg_confidence:.2f}\n\n")
+        
+        append("📋 CATEGORY DISTRIBUTION\n")
+        append(f"{'-'*30}\n")
         for category, count in sorted(categories.items()):
             percentage = (count / total_files) * 100
-            stats += f"{category}: {count} files ({percentage:.1f}%)\n"
+            append(f"{category}: {count} files ({percentage:.1f}%)\n")
         
         if self.worker and hasattr(self.worker, 'start_time'):
             elapsed = time.time() - self.worker.start_time
             throughput = total_files / elapsed if elapsed > 0 else 0
-            stats += f"\n⚡ PERFORMANCE METRICS\n"
-            stats += f"{'-'*30}\n"
-            stats += f"Total Time: {elapsed:.2f}s\n"
-            stats += f"Throughput: {throughput:.1f} files/sec\n"
-            stats += f"Avg Time per File: {(elapsed/total_files)*1000:.1f}ms\n"
+            append("\n⚡ PERFORMANCE METRICS\n")
+            append(f"{'-'*30}\n")
+            append(f"Total Time: {elapsed:.2f}s\n")
+            append(f"Throughput: {throughput:.1f} files/sec\n")
+            append(f"Avg Time per File: {(elapsed/total_files)*1000:.1f}ms\n")
         
-        self.performance_text.setText(stats)
+        self.performance_text.setText("".join(parts))
     
     def log_message(self, message):
-        """Add message to log."""
+        """Add message to log; the widget is updated on the next flush."""
         timestamp = time.strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
-        self.log_text.append(formatted_message)
+        self._log_buf.append(f"[{timestamp}] {message}")
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
+    
+    def flush_log(self):
+        """Append all buffered log lines to the log view in one edit."""
+        if not self._log_buf:
+            return
+        self.log_text.appendPlainText("\n".join(self._log_buf))
+        self._log_buf.clear()
         
         # Auto-scroll to bottom
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        self.log_text.setTextCursor(cursor)
-    
-    def update_display(self):
-        """Update display with real-time information."""
-        # This runs every second to update any real-time displays
-        pass
+        self.log_text.moveCursor(QTextCursor.MoveOperation.End)
     
     def closeEvent(self, event):
         """Handle window close event."""
         if self.worker and self.worker.isRunning():
+            if self._close_pending:
+                event.ignore()  # Already stopping; the window closes when the worker ends
+                return
             reply = QMessageBox.question(
                 self, 
                 'Confirm Exit', 
@@ -579,9 +753,16 @@ class EnhancedMainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                self.worker.terminate()
-                self.worker.wait()
-                event.accept()
+                self.worker.cancel()
+                if self.worker.wait(3000):  # Cancellation is polled per file
+                    event.accept()
+                else:
+                    # Stuck in a call that can't be interrupted; close once the thread ends
+                    self._close_pending = True
+                    self.worker.finished.connect(self.close)
+                    self.stop_btn.setEnabled(False)
+                    self.status_label.setText("⏹️ Stopping analysis before exit...")
+                    event.ignore()
             else:
                 event.ignore()
         else:
@@ -1,4 +1,10 @@
-from PyQt6.QtCore import Qt
+import functools
+import importlib
+import re
+import threading
+import time
+
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThread, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -13,16 +19,42 @@ from PyQt6.QtWidgets import (
     QComboBox,
     QDialogButtonBox,
     QMessageBox,
-    QMenuBar,
-    QMenu,
 )
-from PyQt6.QtCore import QThread, pyqtSignal
 from PyQt6.QtGui import QAction
 
 from sentinel.app.config_manager import ConfigManager
 from sentinel.app.ui.review_dialog import ReviewDialog
 from sentinel.app.ui.debug_dialog import DebugDialog
 
+# Progress updates from AnalysisWorker are coalesced to at most one per interval (seconds)
+PROGRESS_EMIT_INTERVAL = 0.05
+
+# Dialogs imported on first use: name -> (module, class). ImportWarmupTask
+# loads them in the background once the main window is shown.
+LAZY_DIALOGS = {
+    'preflight': ('sentinel.app.ui.preflight_dialog', 'PreFlightDialog'),
+    'engine_room': ('sentinel.app.ui.real_engine_room', 'RealEngineRoomDialog'),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_dialog_class(name: str):
+    """Import and return the dialog class registered under *name*."""
+    module_name, class_name = LAZY_DIALOGS[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class ImportWarmupTask(QRunnable):
+    """Import the lazily loaded dialogs so their first open doesn't stall the UI."""
+
+    def run(self):
+        for name in LAZY_DIALOGS:
+            try:
+                _load_dialog_class(name)
+            except Exception:  # noqa: BLE001
+                pass  # Reported by the handler when the dialog is opened
+
+
 # ---------------------------------------------------------------------------
 # Worker thread for background analysis (placeholder implementation)
 # ---------------------------------------------------------------------------
@@ -31,7 +63,7 @@ from sentinel.app.ui.debug_dialog import DebugDialog
 class AnalysisWorker(QThread):
     progress_changed = pyqtSignal(int)
     status_changed = pyqtSignal(str)
-    results_ready = pyqtSignal(list)  # Emits list of result dicts
+    results_ready = pyqtSignal()  # Result dicts are left in self.results
     finished_success = pyqtSignal()
 
     def __init__(
@@ -50,10 +82,29 @@ class AnalysisWorker(QThread):
         self.db = db_manager
         self.logger_manager = logger_manager
         self.performance_monitor = performance_monitor
+        self._last_emit = 0.0
+        self._cancelled = threading.Event()
+        self.results: list[dict] = []
         
         if self.logger_manager:
             self.logger = self.logger_manager.get_logger('analysis_worker')
 
+    def cancel(self):
+        """Ask the pipeline to stop at its next cancellation check."""
+        self._cancelled.set()
+
+    def _emit_progress(self, value: int, force: bool = False):
+        """Emit *value* unless another progress update went out within PROGRESS_EMIT_INTERVAL."""
+        now = time.monotonic()
+        if force or now - self._last_emit >= PROGRESS_EMIT_INTERVAL:
+            self._last_emit = now
+            self.progress_changed.emit(value)
+
+    def _on_pipeline_progress(self, processed: int, total: int, current_file: str = ""):
+        """Translate pipeline file counts into a throttled percentage."""
+        if total > 0:
+            self._emit_progress(min(processed * 100 // total, 100))
+
     # pylint: disable=import-outside-toplevel
     def run(self):
         """Execute scanning → inference pipeline (stub)."""
@@ -72,10 +123,14 @@ class AnalysisWorker(QThread):
                 db=self.db, 
                 config=self.config_mgr.config,
                 logger_manager=self.logger_manager,
-                performance_monitor=self.performance_monitor
+                performance_monitor=self.performance_monitor,
+                cancel_cb=self._cancelled.is_set,
+                progress_cb=self._on_pipeline_progress,
             )
-            self.progress_changed.emit(100)
-            self.results_ready.emit(results)
+            self._emit_progress(100, force=True)
+            # Hand the list over by reference; the queued signal carries no payload
+            self.results = results
+            self.results_ready.emit()
             
             if self.logger_manager:
                 self.logger.info(f"Analysis pipeline completed successfully with {len(results)} results")
@@ -89,6 +144,79 @@ class AnalysisWorker(QThread):
             self.finished_success.emit()
 
 
+# One "name, memory" row of `nvidia-smi --query-gpu=name,memory.total --format=csv,noheader,nounits`
+NVIDIA_SMI_GPU_RE = re.compile(r"^[ \t]*(.+?)\s*,\s*(\d+)\s*$", re.MULTILINE)
+
+
+def _parse_nvidia_smi(output: str) -> list:
+    """Turn nvidia-smi CSV output into "name (N MB VRAM)" labels."""
+    return [f"{name} ({memory}MB VRAM)" for name, memory in NVIDIA_SMI_GPU_RE.findall(output)]
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_gpus_cached() -> tuple:
+    """Detect available GPUs once per session, via NVML when pynvml is installed."""
+    gpus = ["Default CPU"]
+    
+    try:
+        import pynvml
+    except ImportError:
+        pynvml = None
+    
+    if pynvml is not None:
+        try:
+            pynvml.nvmlInit()
+            try:
+                for index in range(pynvml.nvmlDeviceGetCount()):
+                    handle = pynvml.nvmlDeviceGetHandleByIndex(index)
+                    name = pynvml.nvmlDeviceGetName(handle)
+                    if isinstance(name, bytes):  # Older nvidia-ml-py releases return bytes
+                        name = name.decode()
+                    memory = pynvml.nvmlDeviceGetMemoryInfo(handle).total // (1024 * 1024)
+                    gpus.append(f"{name} ({memory}MB VRAM)")
+            finally:
+                pynvml.nvmlShutdown()
+        except pynvml.NVMLError:
+            pass
+        return tuple(gpus)
+    
+    # Fallback when pynvml isn't installed
+    try:
+        import subprocess
+        result = subprocess.run([
+            'nvidia-smi', 
+            '--query-gpu=name,memory.total', 
+            '--format=csv,noheader,nounits'
+        ], capture_output=True, text=True, timeout=5)
+        
+        if result.returncode == 0:
+            gpus.extend(_parse_nvidia_smi(result.stdout))
+    except Exception:
+        pass
+    
+    return tuple(gpus)
+
+
+class GpuDetectSignals(QObject):
+    """Signals used by GpuDetectTask to hand the GPU list back to the GUI thread."""
+    finished = pyqtSignal(list)
+
+
+class GpuDetectTask(QRunnable):
+    """Run GPU detection on a thread pool so driver probes never block the UI."""
+
+    def __init__(self, signals: GpuDetectSignals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        gpus = list(_detect_gpus_cached())
+        try:
+            self.signals.finished.emit(gpus)
+        except RuntimeError:
+            pass  # Dialog was destroyed while detection was running
+
+
 class SettingsDialog(QDialog):
     """Simple settings dialog allowing AI backend and GPU selection."""
 
@@ -106,9 +234,23 @@ class SettingsDialog(QDialog):
 
         # GPU selection - detect available GPUs
         self.gpu_combo = QComboBox()
-        available_gpus = self._detect_gpus()
-        self.gpu_combo.addItems(available_gpus)
-        form_layout.addRow("GPU:", self.gpu_combo)
+        self._gpu_signals = GpuDetectSignals(self)
+        self._gpu_signals.finished.connect(self.on_gpus_detected)
+        config_mgr = getattr(parent, "config_mgr", None)
+        if _detect_gpus_cached.cache_info().currsize:
+            self.gpu_combo.addItems(self._detect_gpus())
+        elif config_mgr is not None and config_mgr.config.ai_backend_mode == "cloud":
+            # Cloud mode never uses a local GPU; detect only once Local is picked
+            self.gpu_combo.addItem("Default CPU")
+            self.backend_combo.currentTextChanged.connect(self.on_backend_changed)
+        else:
+            self.start_gpu_detection()
+        refresh_gpus_btn = QPushButton("Refresh")
+        refresh_gpus_btn.clicked.connect(self.refresh_gpus)
+        gpu_row = QHBoxLayout()
+        gpu_row.addWidget(self.gpu_combo, 1)
+        gpu_row.addWidget(refresh_gpus_btn)
+        form_layout.addRow("GPU:", gpu_row)
 
         # OK / Cancel buttons
         buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
@@ -119,29 +261,37 @@ class SettingsDialog(QDialog):
         self.setLayout(form_layout)
 
     def _detect_gpus(self) -> list:
-        """Detect available GPUs."""
-        gpus = ["Default CPU"]
-        
-        try:
-            import subprocess
-            result = subprocess.run([
-                'nvidia-smi', 
-                '--query-gpu=name,memory.total', 
-                '--format=csv,noheader,nounits'
-            ], capture_output=True, text=True, timeout=5)
-            
-            if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    if line.strip():
-                        parts = line.split(', ')
-                        if len(parts) >= 2:
-                            name = parts[0].strip()
-                            memory = parts[1].strip()
-                            gpus.append(f"{name} ({memory}MB VRAM)")
-        except Exception:
-            pass
-        
-        return gpus
+        """Detect available GPUs (cached for the session)."""
+        return list(_detect_gpus_cached())
+
+    def start_gpu_detection(self):
+        """Offer the CPU right away and detect GPUs on the global thread pool."""
+        self.gpu_combo.clear()
+        self.gpu_combo.addItems(["Default CPU", "Detecting GPUs…"])
+        self.gpu_combo.model().item(1).setEnabled(False)
+        QThreadPool.globalInstance().start(GpuDetectTask(self._gpu_signals))
+
+    def on_gpus_detected(self, gpus: list):
+        """Replace the placeholder with the detected GPUs, keeping the selection."""
+        current = self.gpu_combo.currentText()
+        self.gpu_combo.clear()
+        self.gpu_combo.addItems(gpus)
+        self.gpu_combo.setCurrentText(current)
+
+    def on_backend_changed(self, mode: str):
+        """Populate the GPU list the first time the user switches to Local."""
+        if mode != "Local":
+            return
+        self.backend_combo.currentTextChanged.disconnect(self.on_backend_changed)
+        if _detect_gpus_cached.cache_info().currsize:
+            self.on_gpus_detected(self._detect_gpus())
+        else:
+            self.start_gpu_detection()
+
+    def refresh_gpus(self):
+        """Forget the cached GPU list and detect again."""
+        _detect_gpus_cached.cache_clear()
+        self.start_gpu_detection()
 
     def get_settings(self) -> dict:
         """Return the chosen settings as a dict."""
@@ -174,6 +324,12 @@ class MainWindow(QMainWindow):
 
         # Internal state
         self.directory_path: str | None = None
+        self._imports_warmed = False
+        self._engine_room = None
+        self._debug_dialog = None
+        self._settings_dlg: SettingsDialog | None = None
+        self.worker: AnalysisWorker | None = None
+        self._close_pending = False
 
         # UI Elements
         self.select_btn = QPushButton("Select Directory…")
@@ -221,20 +377,13 @@ class MainWindow(QMainWindow):
         # Tools menu
         tools_menu = menubar.addMenu("Tools")
         
-        # Engine Room action (Sentinel 2.0 feature)
-        engine_room_action = QAction("🔧 Engine Room", self)
-        engine_room_action.setStatusTip("Open the Engine Room dashboard for real-time system monitoring")
-        engine_room_action.triggered.connect(self.open_engine_room)
-        tools_menu.addAction(engine_room_action)
-        
-        tools_menu.addSeparator()
-        
         # Debug Info action
         if self.logger_manager and self.debug_collector:
             debug_action = QAction("Debug Information", self)
             debug_action.setStatusTip("Open debug information dialog")
             debug_action.triggered.connect(self.open_debug_dialog)
             tools_menu.addAction(debug_action)
+            tools_menu.addSeparator()
         
         # Engine Room action
         engine_room_action = QAction("🔧 Engine Room", self)
@@ -248,38 +397,18 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
 
-    def open_engine_room(self):
-        """Open the Engine Room dashboard."""
-        try:
-            from sentinel.app.ui.engine_room_dialog import EngineRoomDialog
-            
-            # Create and show the Engine Room dialog
-            engine_room = EngineRoomDialog(self)
-            engine_room.show()  # Use show() instead of exec() for non-modal
-            
-            if self.logger_manager:
-                self.logger.info("Engine Room dashboard opened")
-                
-        except Exception as e:
-            if self.logger_manager:
-                self.logger.error(f"Failed to open Engine Room: {e}", exc_info=True)
-            
-            QMessageBox.warning(
-                self,
-                "Engine Room Unavailable",
-                f"Failed to open Engine Room dashboard: {e}"
-            )
-
     def open_debug_dialog(self):
         """Open the debug information dialog."""
         if self.logger_manager and self.debug_collector:
-            debug_dialog = DebugDialog(
-                logger_manager=self.logger_manager,
-                performance_monitor=self.performance_monitor,
-                debug_collector=self.debug_collector,
-                parent=self
-            )
-            debug_dialog.exec()
+            if self._debug_dialog is None:
+                self._debug_dialog = DebugDialog(
+                    logger_manager=self.logger_manager,
+                    performance_monitor=self.performance_monitor,
+                    debug_collector=self.debug_collector,
+                    parent=self
+                )
+                self._debug_dialog.destroyed.connect(self._forget_debug_dialog)
+            self._debug_dialog.exec()
             
             if self.logger_manager:
                 self.logger.info("Debug dialog opened")
@@ -287,10 +416,15 @@ class MainWindow(QMainWindow):
     def open_engine_room(self):
         """Open the real-time engine room monitoring."""
         try:
-            from sentinel.app.ui.real_engine_room import RealEngineRoomDialog
+            # Build the dialog once; later opens just bring it back to the front
+            if self._engine_room is None:
+                RealEngineRoomDialog = _load_dialog_class('engine_room')
+                self._engine_room = RealEngineRoomDialog(self)
+                self._engine_room.destroyed.connect(self._forget_engine_room)
             
-            engine_room = RealEngineRoomDialog(self)
-            engine_room.show()  # Non-modal so user can interact with main window
+            self._engine_room.show()  # Non-modal so user can interact with main window
+            self._engine_room.raise_()
+            self._engine_room.activateWindow()
             
             if self.logger_manager:
                 self.logger.info("Engine Room opened")
@@ -305,6 +439,14 @@ class MainWindow(QMainWindow):
                 f"Failed to open Engine Room: {e}"
             )
     
+    def _forget_engine_room(self, *_):
+        """Drop the cached Engine Room once Qt destroys it."""
+        self._engine_room = None
+    
+    def _forget_debug_dialog(self, *_):
+        """Drop the cached debug dialog once Qt destroys it."""
+        self._debug_dialog = None
+    
     def show_about(self):
         """Show about dialog."""
         QMessageBox.about(
@@ -343,9 +485,9 @@ class MainWindow(QMainWindow):
         if self.logger_manager:
             self.logger.info(f"Opening pre-flight check for directory: {self.directory_path}")
 
-        # Import the pre-flight dialog
+        # Import the pre-flight dialog (usually already warmed in the background)
         try:
-            from sentinel.app.ui.preflight_dialog import PreFlightDialog
+            PreFlightDialog = _load_dialog_class('preflight')
             
             # Launch pre-flight dialog
             preflight_dialog = PreFlightDialog(self.directory_path, self)
@@ -433,8 +575,11 @@ class MainWindow(QMainWindow):
             self.logger.info("Analysis workflow completed")
 
     # ---------------------- Review Dialog -----------------------------
-    def show_review_dialog(self, results: list):  # noqa: D401
-        """Launch ReviewDialog with provided *results*."""
+    def show_review_dialog(self):  # noqa: D401
+        """Launch ReviewDialog with the finished worker's results."""
+        if self._close_pending:
+            return  # A queued emission from a run cancelled on close
+        results = self.worker.results
         if not results:
             QMessageBox.information(self, "Review", "No results to review.")
             return
@@ -442,27 +587,56 @@ class MainWindow(QMainWindow):
         dlg = ReviewDialog(results, self.db, self)
         dlg.exec()
 
+    # ------------------------------------------------------------------
+    # Window events
+    # ------------------------------------------------------------------
+
+    def showEvent(self, event):  # noqa: D401
+        """Warm the lazily imported dialogs once the window is first shown."""
+        super().showEvent(event)
+        if not self._imports_warmed:
+            self._imports_warmed = True
+            QThreadPool.globalInstance().start(ImportWarmupTask())
+
     # ------------------------------------------------------------------
     # Cleanup
     # ------------------------------------------------------------------
 
     def closeEvent(self, event):  # noqa: D401
         """Ensure background worker is terminated before window closes."""
-        try:
-            if hasattr(self, "worker") and self.worker.isRunning():
-                self.worker.quit()
-                self.worker.wait(3000)  # wait up to 3 seconds
-        except Exception:  # noqa: BLE001
-            pass
+        if self.worker is not None and self.worker.isRunning():
+            if self._close_pending:
+                event.ignore()  # Already stopping; the window closes when the worker ends
+                return
+            # Partial results from a cancelled run must not open the review dialog
+            self._close_pending = True
+            try:
+                self.worker.results_ready.disconnect(self.show_review_dialog)
+            except TypeError:
+                pass  # Not connected
+            # run() never enters an event loop, so quit() would be a no-op;
+            # cancel cooperatively and wait only for the current batch to finish
+            self.worker.cancel()
+            if not self.worker.wait(3000):
+                # Stuck in a call that can't be interrupted; close once the thread ends
+                self.worker.finished.connect(self.close)
+                self.status_label.setText("Stopping analysis before exit…")
+                event.ignore()
+                return
         super().closeEvent(event)
 
     def open_settings(self):
-        dlg = SettingsDialog(self)
+        # Build the dialog once; later openings only re-sync it with the config
+        if self._settings_dlg is None:
+            self._settings_dlg = SettingsDialog(self)
+        dlg = self._settings_dlg
         # Preselect current backend mode
         dlg.backend_combo.setCurrentText(self.config_mgr.config.ai_backend_mode.title())
         if dlg.exec():
             settings = dlg.get_settings()
             self.config_mgr.set_backend_mode(settings["ai_backend_mode"])
+            if self.debug_collector:
+                self.debug_collector.config['ai_backend_mode'] = self.config_mgr.config.ai_backend_mode
             self.status_label.setText(
                 f"Backend: {self.config_mgr.config.ai_backend_mode.title()}, GPU: {settings['gpu']}"
             ) 
\ No newline at end of file
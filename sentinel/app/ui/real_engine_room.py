@@ -78,6 +78,8 @@ class SystemMonitor(QThread):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.running = True
+        # Set by stop(); the loop sleeps on it so a stop request cuts the wait short
+        self._stop_event = threading.Event()
         self.last_disk_io = None
         self.last_network_io = None
         
@@ -87,10 +89,17 @@ class SystemMonitor(QThread):
             try:
                 metrics = self.collect_real_metrics()
                 self.metrics_updated.emit(metrics)
-                time.sleep(1.0)  # Update every second
+                self._stop_event.wait(1.0)  # Update every second
             except Exception as e:
                 print(f"System monitoring error: {e}")
-                time.sleep(5.0)  # Wait longer on error
+                self._stop_event.wait(5.0)  # Wait longer on error
+    
+    def resume(self):
+        """Start monitoring again after stop(), waiting out a previous run first."""
+        self.wait()
+        self.running = True
+        self._stop_event.clear()
+        self.start()
     
     def collect_real_metrics(self) -> SystemMetrics:
         """Collect actual system metrics."""
@@ -165,6 +174,7 @@ class SystemMonitor(QThread):
     def stop(self):
         """Stop monitoring."""
         self.running = False
+        self._stop_event.set()
 
 
 class RealWorkerCard(QWidget):
@@ -709,6 +719,13 @@ Last Updated: {time.strftime('%H:%M:%S')}
             self.update_system_metrics(self.current_metrics)
         self.update_worker_states()
     
+    def showEvent(self, event):
+        """Resume monitoring when a previously closed dialog is shown again."""
+        super().showEvent(event)
+        # A monitor that is still winding down from stop() would exit on its own
+        if not self.system_monitor.running:
+            self.system_monitor.resume()
+    
     def closeEvent(self, event):
         """Clean up when closing."""
         self.system_monitor.stop()
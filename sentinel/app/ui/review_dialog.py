@@ -1,18 +1,118 @@
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QPushButton,
     QMessageBox,
-    QCheckBox,
 )
 
+APPROVED_COLOR = QColor(Qt.GlobalColor.green)
+REJECTED_COLOR = QColor(Qt.GlobalColor.red)
+
+
+class ReviewTableModel(QAbstractTableModel):
+    """Table model over review results stored as one list per column.
+
+    Column 0 is a user-checkable approval box and column 2 (the suggested
+    path) is editable; the other columns are read-only.
+    """
+
+    CHECK_COLUMN = 0
+    SUGGESTED_COLUMN = 2
+
+    def __init__(self, headers: list[str], parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._load([])
+
+    def _load(self, results: list[dict]):
+        self.file_ids = [r.get("file_id", -1) for r in results]
+        self.original_paths = [r.get("original_path", "") for r in results]
+        self.suggested_paths = [r.get("suggested_path", "") for r in results]
+        self.confidences = [f"{r.get('confidence', 0.0):.2f}" for r in results]
+        self.justifications = [r.get("justification", "") for r in results]
+        self.checked = [True] * len(results)  # Default select all
+        self.marks: list[QColor | None] = [None] * len(results)
+        self._text_columns = {
+            1: self.original_paths,
+            2: self.suggested_paths,
+            3: self.confidences,
+            4: self.justifications,
+        }
+
+    def set_results(self, results: list[dict]):
+        """Replace all rows with *results* in a single model reset."""
+        self.beginResetModel()
+        self._load(results)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.file_ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if column == self.CHECK_COLUMN:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if self.checked[row] else Qt.CheckState.Unchecked
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._text_columns[column][row]
+        if role == Qt.ItemDataRole.BackgroundRole and column == self.SUGGESTED_COLUMN:
+            return self.marks[row]
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid():
+            return False
+        row, column = index.row(), index.column()
+
+        if column == self.CHECK_COLUMN and role == Qt.ItemDataRole.CheckStateRole:
+            self.checked[row] = Qt.CheckState(value) == Qt.CheckState.Checked
+        elif column == self.SUGGESTED_COLUMN and role == Qt.ItemDataRole.EditRole:
+            self.suggested_paths[row] = str(value)
+        else:
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+        if index.column() == self.CHECK_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        elif index.column() == self.SUGGESTED_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+
+    def mark_rows(self, rows, color: QColor):
+        """Colour the suggested-path cell of *rows*, repainting them in one update."""
+        rows = list(rows)
+        if not rows:
+            return
+        for row in rows:
+            self.marks[row] = color
+        self.dataChanged.emit(
+            self.index(min(rows), self.SUGGESTED_COLUMN),
+            self.index(max(rows), self.SUGGESTED_COLUMN),
+            [Qt.ItemDataRole.BackgroundRole],
+        )
+
 
 class ReviewDialog(QDialog):
     """Dialog for reviewing AI path suggestions and approving/rejecting them."""
@@ -35,8 +135,9 @@ class ReviewDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Results table
-        self.table = QTableWidget(len(results), len(self.HEADERS))
-        self.table.setHorizontalHeaderLabels(self.HEADERS)
+        self.model = ReviewTableModel(self.HEADERS, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.populate_table(results)
         layout.addWidget(self.table)
@@ -67,59 +168,26 @@ class ReviewDialog(QDialog):
     # ------------------------ Table Helpers ----------------------------
     def populate_table(self, results: list[dict]):
         """Fill table with result rows."""
-        for row, res in enumerate(results):
-            # Checkbox
-            chk = QCheckBox()
-            chk.setChecked(True)  # Default select all
-            self.table.setCellWidget(row, 0, chk)
-
-            # Store file_id in checkbox property for later lookup
-            chk.setProperty("file_id", res.get("file_id", -1))
-
-            # Original Path (read-only)
-            item_orig = QTableWidgetItem(res.get("original_path", ""))
-            item_orig.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-            self.table.setItem(row, 1, item_orig)
-
-            # AI Suggested Path (editable)
-            item_sugg = QTableWidgetItem(res.get("suggested_path", ""))
-            item_sugg.setFlags(item_sugg.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 2, item_sugg)
-
-            # Confidence (read-only)
-            conf = res.get("confidence", 0.0)
-            item_conf = QTableWidgetItem(f"{conf:.2f}")
-            item_conf.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-            self.table.setItem(row, 3, item_conf)
-
-            # Justification (read-only)
-            item_just = QTableWidgetItem(res.get("justification", ""))
-            item_just.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-            self.table.setItem(row, 4, item_just)
+        self.model.set_results(results)
 
     # ------------------------ Action Slots ----------------------------
     def _iterate_checked_rows(self):
-        for row in range(self.table.rowCount()):
-            chk: QCheckBox = self.table.cellWidget(row, 0)
-            if chk and chk.isChecked():
+        for row, checked in enumerate(self.model.checked):
+            if checked:
                 yield row
 
     def approve_selected(self):
         # Placeholder implementation: mark background color
-        for row in self._iterate_checked_rows():
-            self.table.item(row, 2).setBackground(Qt.GlobalColor.green)
+        self.model.mark_rows(self._iterate_checked_rows(), APPROVED_COLOR)
 
     def reject_selected(self):
-        for row in self._iterate_checked_rows():
-            self.table.item(row, 2).setBackground(Qt.GlobalColor.red)
+        self.model.mark_rows(self._iterate_checked_rows(), REJECTED_COLOR)
 
     def approve_all(self):
-        for row in range(self.table.rowCount()):
-            self.table.item(row, 2).setBackground(Qt.GlobalColor.green)
+        self.model.mark_rows(range(self.model.rowCount()), APPROVED_COLOR)
 
     def reject_all(self):
-        for row in range(self.table.rowCount()):
-            self.table.item(row, 2).setBackground(Qt.GlobalColor.red)
+        self.model.mark_rows(range(self.model.rowCount()), REJECTED_COLOR)
 
     def apply_changes(self):
         reply = QMessageBox.question(
@@ -133,18 +201,14 @@ class ReviewDialog(QDialog):
             import os
             from pathlib import Path
 
-            for row in range(self.table.rowCount()):
-                chk: QCheckBox = self.table.cellWidget(row, 0)
-                file_id = chk.property("file_id")
+            model = self.model
+            for row, file_id in enumerate(model.file_ids):
                 if file_id == -1:
                     continue  # stub rows
 
-                approved = chk.isChecked()
-
-                orig_item = self.table.item(row, 1)
-                suggested_item = self.table.item(row, 2)
-                orig_path = orig_item.text() if orig_item else ""
-                revised_path = suggested_item.text() if suggested_item else orig_path
+                approved = model.checked[row]
+                orig_path = model.original_paths[row]
+                revised_path = model.suggested_paths[row]
 
                 if approved:
                     try:
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test suite for DatabaseManager bulk persistence
+Covers the batched scan/inference upserts used by the legacy pipeline
+"""
+
+import pytest
+
+from sentinel.app.db import DatabaseManager
+
+
+def _meta(path, size=1):
+    return {"path": path, "mime_type": "text/plain", "size": size, "creation_date": None, "checksum": None}
+
+
+def _inference(suggested_path, confidence=0.5):
+    return {"suggested_path": suggested_path, "confidence": confidence, "justification": "test"}
+
+
+class TestDatabaseManagerBulk:
+    """Test cases for save_scan_results_many / save_inferences_many."""
+
+    @pytest.fixture
+    def db(self):
+        """Create an in-memory database with the schema installed."""
+        db = DatabaseManager(":memory:")
+        db.init_schema()
+        yield db
+        db.engine.dispose()
+
+    def _count(self, db, model):
+        with db.SessionFactory() as session:
+            return session.query(model).count()
+
+    def test_ids_follow_input_order(self, db):
+        """Returned IDs line up with the input rows."""
+        paths = ["/c.txt", "/a.txt", "/b.txt"]
+        file_ids = db.save_scan_results_many([_meta(p) for p in paths])
+
+        assert len(file_ids) == len(paths)
+        with db.SessionFactory() as session:
+            stored = {f.id: f.path for f in session.query(db.File)}
+        assert [stored[file_id] for file_id in file_ids] == paths
+
+    def test_duplicate_paths_in_one_batch_share_a_row(self, db):
+        """A path repeated within a batch is stored once and gets the same ID each time."""
+        file_ids = db.save_scan_results_many([_meta("/a.txt"), _meta("/b.txt"), _meta("/a.txt")])
+
+        assert file_ids[0] == file_ids[2]
+        assert file_ids[0] != file_ids[1]
+        assert self._count(db, db.File) == 2
+
+    def test_resaving_existing_paths_keeps_ids(self, db):
+        """Paths already in the database keep their ID instead of duplicating."""
+        first = db.save_scan_results_many([_meta("/a.txt"), _meta("/b.txt")])
+        second = db.save_scan_results_many([_meta("/b.txt"), _meta("/new.txt"), _meta("/a.txt")])
+
+        assert second[0] == first[1]
+        assert second[2] == first[0]
+        assert second[1] not in first
+        assert self._count(db, db.File) == 3
+
+    def test_matches_single_row_api(self, db):
+        """Bulk and single-row saves resolve the same path to the same ID."""
+        single_id = db.save_scan_result(_meta("/a.txt"))
+
+        assert db.save_scan_results_many([_meta("/a.txt")]) == [single_id]
+
+    def test_missing_path_rejected(self, db):
+        """Rows without a path are refused before anything is written."""
+        with pytest.raises(ValueError):
+            db.save_scan_results_many([_meta("/a.txt"), {"size": 1}])
+        assert self._count(db, db.File) == 0
+
+    def test_inferences_upsert_on_resave(self, db):
+        """Re-saving an inference updates the existing row."""
+        file_ids = db.save_scan_results_many([_meta("/a.txt"), _meta("/b.txt")])
+        db.save_inferences_many(zip(file_ids, [_inference("/old/a"), _inference("/old/b")]))
+        db.save_inferences_many([(file_ids[0], _inference("/new/a", confidence=0.9))])
+
+        assert self._count(db, db.Inference) == 2
+        with db.SessionFactory() as session:
+            rows = {inf.file_id: inf for inf in session.query(db.Inference)}
+        assert rows[file_ids[0]].suggested_path == "/new/a"
+        assert rows[file_ids[0]].confidence == pytest.approx(0.9)
+        assert rows[file_ids[1]].suggested_path == "/old/b"
+
+    def test_inferences_duplicate_file_id_in_one_batch(self, db):
+        """The last inference for a file ID within one batch wins."""
+        (file_id,) = db.save_scan_results_many([_meta("/a.txt")])
+        db.save_inferences_many([(file_id, _inference("/first")), (file_id, _inference("/second"))])
+
+        assert self._count(db, db.Inference) == 1
+        with db.SessionFactory() as session:
+            assert session.query(db.Inference).one().suggested_path == "/second"
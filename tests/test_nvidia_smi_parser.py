@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test suite for the nvidia-smi fallback parser in the main window
+Feeds sample `--query-gpu=name,memory.total --format=csv,noheader,nounits` output
+"""
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+from sentinel.app.ui.main_window import _parse_nvidia_smi
+
+
+class TestParseNvidiaSmi:
+    """Test cases for _parse_nvidia_smi."""
+
+    def test_multiple_gpus(self):
+        """Each CSV line becomes one label, in output order."""
+        output = "NVIDIA GeForce RTX 3060 Ti, 8192\nNVIDIA A100-SXM4-40GB, 40960\n"
+
+        assert _parse_nvidia_smi(output) == [
+            "NVIDIA GeForce RTX 3060 Ti (8192MB VRAM)",
+            "NVIDIA A100-SXM4-40GB (40960MB VRAM)",
+        ]
+
+    def test_name_with_commas(self):
+        """Only the last comma separates the memory column from the name."""
+        output = "Tesla V100, PCIe, 16GB, 16384\nGPU, 2 Max, 8192\n"
+
+        assert _parse_nvidia_smi(output) == [
+            "Tesla V100, PCIe, 16GB (16384MB VRAM)",
+            "GPU, 2 Max (8192MB VRAM)",
+        ]
+
+    def test_surrounding_whitespace_and_crlf(self):
+        """Padding around fields and Windows line endings are ignored."""
+        output = "  Quadro RTX 4000 ,   8192  \r\n\r\n   NVIDIA T4,15360\r\n"
+
+        assert _parse_nvidia_smi(output) == [
+            "Quadro RTX 4000 (8192MB VRAM)",
+            "NVIDIA T4 (15360MB VRAM)",
+        ]
+
+    @pytest.mark.parametrize("output", ["", "\n", "   \n\n"])
+    def test_empty_output(self, output):
+        """No GPUs listed means no labels."""
+        assert _parse_nvidia_smi(output) == []
+
+    def test_non_csv_lines_skipped(self):
+        """Error text or lines without a numeric memory column are ignored."""
+        output = (
+            "NVIDIA-SMI has failed because it couldn't communicate with the NVIDIA driver.\n"
+            "GeForce GTX 1080, [N/A]\n"
+            "GeForce GTX 1070, 8192\n"
+        )
+
+        assert _parse_nvidia_smi(output) == ["GeForce GTX 1070 (8192MB VRAM)"]
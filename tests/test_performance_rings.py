@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test suite for the PerformanceMonitor ring structures
+Compares the hand-rolled rings against plain deques after wrap-around
+"""
+
+from collections import deque
+from datetime import datetime
+
+import pytest
+
+from sentinel.app.logging.performance_monitor import ErrorRing, RingStats
+
+
+class TestRingStats:
+    """Test cases for RingStats."""
+
+    @pytest.mark.parametrize("count", [0, 1, 9, 10, 11, 37])
+    def test_matches_deque_after_wrap(self, count):
+        """len, sum and iteration order track a deque(maxlen) exactly."""
+        ring = RingStats(maxlen=10)
+        reference = deque(maxlen=10)
+        for value in range(count):
+            ring.append(value * 3 + 1)
+            reference.append(value * 3 + 1)
+
+        assert len(ring) == len(reference)
+        assert ring.sum == sum(reference)
+        assert list(ring) == list(reference)
+
+    def test_extend_matches_append(self):
+        """extend() keeps the running sum consistent across several wraps."""
+        ring = RingStats(maxlen=7)
+        reference = deque(maxlen=7)
+        for chunk in ([5, 1, 4], list(range(20)), [100], [], [2, 2, 2, 2, 2, 2, 2, 2]):
+            ring.extend(chunk)
+            reference.extend(chunk)
+            assert ring.sum == sum(reference)
+            assert list(ring) == list(reference)
+
+    def test_no_drift_over_many_wraps(self):
+        """The running sum stays exact after thousands of evictions."""
+        ring = RingStats(maxlen=100)
+        reference = deque(maxlen=100)
+        for value in range(10_000):
+            duration_ns = (value * 7919) % 1_000_003
+            ring.append(duration_ns)
+            reference.append(duration_ns)
+
+        assert len(ring) == 100
+        assert ring.sum == sum(reference)
+
+
+class TestErrorRing:
+    """Test cases for ErrorRing."""
+
+    def _fill(self, ring, count):
+        reference = deque(maxlen=ring.capacity)
+        for n in range(count):
+            detail = ("model", f"m{n}") if n % 2 else None
+            ring.append(1_700_000_000.0 + n, n / 10, f"error {n}", detail)
+            reference.append((1_700_000_000.0 + n, n / 10, f"error {n}", detail))
+        return reference
+
+    def _as_dict(self, timestamp, duration, message, detail):
+        error = {
+            "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+            "error": message,
+            "duration": duration,
+        }
+        if detail is not None:
+            error[detail[0]] = detail[1]
+        return error
+
+    @pytest.mark.parametrize("count", [0, 3, 5, 6, 23])
+    def test_latest_oldest_first_after_wrap(self, count):
+        """latest() returns the surviving errors oldest first, like a deque."""
+        ring = ErrorRing(capacity=5)
+        reference = self._fill(ring, count)
+
+        assert len(ring) == len(reference)
+        assert ring.latest() == [self._as_dict(*entry) for entry in reference]
+
+    @pytest.mark.parametrize("limit", [0, 1, 3, 5, 50])
+    def test_latest_limit_keeps_newest(self, limit):
+        """A limit trims from the old end, keeping oldest-first order."""
+        ring = ErrorRing(capacity=5)
+        reference = list(self._fill(ring, 13))
+
+        expected = reference[len(reference) - min(limit, len(reference)):]
+        assert ring.latest(limit) == [self._as_dict(*entry) for entry in expected]
+
+    def test_overwritten_detail_does_not_leak(self):
+        """A slot reused by an error without detail drops the old detail key."""
+        ring = ErrorRing(capacity=1)
+        ring.append(1_700_000_000.0, 0.1, "with detail", ("model", "m"))
+        ring.append(1_700_000_001.0, 0.2, "plain")
+
+        (error,) = ring.latest()
+        assert error["error"] == "plain"
+        assert "model" not in error
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test suite for the DebugDialog RowTableModel
+Checks which model signals set_rows emits for each kind of update
+"""
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from sentinel.app.ui.debug_dialog import RowTableModel
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Provide a (headless) QApplication for the Qt models."""
+    return QApplication.instance() or QApplication([])
+
+
+class TestRowTableModelSetRows:
+    """Test cases for RowTableModel.set_rows."""
+
+    ROWS = [("a", "1", "x"), ("b", "2", "y"), ("c", "3", "z")]
+
+    @pytest.fixture
+    def model(self, qapp):
+        """Create a model already showing ROWS, with signal recorders attached."""
+        model = RowTableModel(["Name", "Value", "Extra"])
+        model.set_rows(self.ROWS)
+        model.changes = []
+        model.resets = []
+        model.dataChanged.connect(
+            lambda top_left, bottom_right, roles: model.changes.append(
+                ((top_left.row(), top_left.column()), (bottom_right.row(), bottom_right.column()))
+            )
+        )
+        model.modelReset.connect(lambda: model.resets.append(True))
+        return model
+
+    def test_single_cell_change_emits_one_data_changed(self, model):
+        """One changed cell repaints exactly that cell."""
+        rows = list(self.ROWS)
+        rows[1] = ("b", "20", "y")
+
+        assert model.set_rows(rows) is True
+        assert model.changes == [((1, 1), (1, 1))]
+        assert model.resets == []
+        assert model.index(1, 1).data() == "20"
+
+    def test_scattered_changes_emit_bounding_box(self, model):
+        """Several changed cells are folded into one bounding-box update."""
+        rows = [("A", "1", "x"), ("b", "2", "y"), ("c", "3", "Z")]
+
+        assert model.set_rows(rows) is True
+        assert model.changes == [((0, 0), (2, 2))]
+        assert model.resets == []
+
+    def test_row_count_change_resets(self, model):
+        """Adding a row falls back to a full model reset."""
+        assert model.set_rows(self.ROWS + [("d", "4", "w")]) is True
+        assert model.resets == [True]
+        assert model.changes == []
+        assert model.rowCount() == 4
+
+    def test_row_shape_change_resets(self, model):
+        """A row whose cell count changes (e.g. an error row) forces a reset."""
+        rows = list(self.ROWS)
+        rows[2] = ("Error", "boom")
+
+        assert model.set_rows(rows) is True
+        assert model.resets == [True]
+        assert model.changes == []
+        assert model.index(2, 2).data() is None
+
+    def test_identical_rows_emit_nothing(self, model):
+        """Setting the same rows again emits no signal at all."""
+        assert model.set_rows(list(self.ROWS)) is False
+        assert model.changes == []
+        assert model.resets == []
+
+    def test_forced_reset(self, model):
+        """reset=True always resets, even for identical rows."""
+        assert model.set_rows(self.ROWS, reset=True) is False
+        assert model.resets == [True]